@@ -2,37 +2,20 @@
 
 from __future__ import annotations
 
-import importlib.util
-import sys
 from pathlib import Path
 
 _PACKAGE_ROOT = Path(__file__).resolve().parent
 _SRC_PACKAGE = _PACKAGE_ROOT.parent / "src" / "driftbuster"
+_SRC_INIT = _SRC_PACKAGE / "__init__.py"
 
-if not _SRC_PACKAGE.exists():  # pragma: no cover - defensive guard
+if not _SRC_INIT.exists():  # pragma: no cover - defensive guard
     raise ImportError(
         "Unable to locate src/driftbuster; editable layout is required for CLI runs."
     )
 
-_spec = importlib.util.spec_from_file_location(
-    "_driftbuster_src",
-    _SRC_PACKAGE / "__init__.py",
-    submodule_search_locations=[str(_SRC_PACKAGE)],
-)
-if _spec is None or _spec.loader is None:  # pragma: no cover - defensive guard
-    raise ImportError("Failed to load driftbuster package from src layout")
-
-_module = importlib.util.module_from_spec(_spec)
-_sys_modules = sys.modules
-_sys_modules.setdefault("_driftbuster_src", _module)
-_spec.loader.exec_module(_module)
-
-# Re-export public attributes from the real package.
-for name, value in list(_module.__dict__.items()):
-    if name.startswith("__") and name not in {"__all__", "__path__"}:
-        continue
-    globals()[name] = value
-
-# Ensure imports like ``import driftbuster.core`` find the src directory.
+# Point the package at the src directory first, then run the real package
+# initialiser inside this module. Loading it under a second module name would
+# execute every submodule twice (``_driftbuster_src.registry`` alongside
+# ``driftbuster.registry``), duplicating plugin registries and usage counters.
 __path__ = [str(_SRC_PACKAGE)]
-
+exec(compile(_SRC_INIT.read_text(encoding="utf-8"), str(_SRC_INIT), "exec"), globals())
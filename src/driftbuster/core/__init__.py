@@ -5,6 +5,7 @@ from .profiles import (
     AppliedProfileConfig,
     ConfigurationProfile,
     ProfileConfig,
+    ProfileMatchIndex,
     ProfileStore,
     ProfiledDetection,
     diff_summary_snapshots,
@@ -22,6 +23,7 @@ __all__ = [
     "ConfigurationProfile",
     "Detector",
     "ProfileConfig",
+    "ProfileMatchIndex",
     "ProfileStore",
     "ProfiledDetection",
     "DetectionMatch",
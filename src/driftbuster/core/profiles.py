@@ -8,8 +8,10 @@ deterministically.
 
 from __future__ import annotations
 
+import os
+import re
 from dataclasses import dataclass, field, replace
-from fnmatch import fnmatch
+from fnmatch import fnmatch, translate
 from pathlib import Path, PurePosixPath
 from types import MappingProxyType
 from typing import (
@@ -78,19 +80,9 @@ class ProfileConfig:
     ) -> bool:
         """Return ``True`` when the config applies to the given path + tags."""
 
-        if self.tags and not self.tags.issubset(provided_tags):
+        if not self._matches_tags(provided_tags):
             return False
 
-        for prefix, value in (
-            ("application", self.application),
-            ("version", self.version),
-            ("branch", self.branch),
-        ):
-            if value is None:
-                continue
-            if f"{prefix}:{value}" not in provided_tags:
-                return False
-
         if self.path is None and self.path_glob is None:
             return True
 
@@ -105,6 +97,21 @@ class ProfileConfig:
             return True
         return False
 
+    def _matches_tags(self, provided_tags: FrozenSet[str]) -> bool:
+        if self.tags and not self.tags.issubset(provided_tags):
+            return False
+
+        for prefix, value in (
+            ("application", self.application),
+            ("version", self.version),
+            ("branch", self.branch),
+        ):
+            if value is None:
+                continue
+            if f"{prefix}:{value}" not in provided_tags:
+                return False
+        return True
+
 
 @dataclass(frozen=True)
 class ConfigurationProfile:
@@ -162,6 +169,61 @@ class ProfiledDetection:
     profiles: Tuple[AppliedProfileConfig, ...]
 
 
+class ProfileMatchIndex:
+    """Path lookup over the configs that apply under a fixed tag set.
+
+    Built by :meth:`ProfileStore.prepare_index`. Tag rules are resolved once
+    when the index is created, so :meth:`match` only evaluates path rules:
+    exact paths through a dictionary and globs through a single combined
+    regex pre-check before the per-glob matchers run. The index is a snapshot
+    and does not observe later store mutations.
+    """
+
+    def __init__(self, candidates: Sequence[AppliedProfileConfig]) -> None:
+        self._candidates = tuple(candidates)
+        unconditional: list[int] = []
+        self._by_path: dict[str, list[int]] = {}
+        globs: list[tuple[int, Callable[[str], Any]]] = []
+        patterns: list[str] = []
+        for position, applied in enumerate(self._candidates):
+            config = applied.config
+            if config.path is None and config.path_glob is None:
+                unconditional.append(position)
+                continue
+            if config.path:
+                self._by_path.setdefault(config.path, []).append(position)
+            if config.path_glob:
+                # Mirror ``fnmatch``: both sides are case-folded via normcase.
+                pattern = translate(os.path.normcase(config.path_glob))
+                globs.append((position, re.compile(pattern).match))
+                patterns.append(pattern)
+        self._unconditional = tuple(unconditional)
+        self._globs = tuple(globs)
+        self._any_glob = (
+            re.compile("|".join(f"(?:{pattern})" for pattern in patterns)).match
+            if patterns
+            else None
+        )
+
+    def match(self, relative_path: Optional[str]) -> Tuple[AppliedProfileConfig, ...]:
+        """Return matches for ``relative_path`` in store registration order."""
+
+        candidates = self._candidates
+        if relative_path is None:
+            return tuple(candidates[position] for position in self._unconditional)
+
+        normalised = _normalize_path(relative_path)
+        positions = set(self._unconditional)
+        positions.update(self._by_path.get(normalised, ()))
+        if self._any_glob is not None:
+            folded = os.path.normcase(normalised)
+            if self._any_glob(folded):
+                positions.update(
+                    position for position, matcher in self._globs if matcher(folded)
+                )
+        return tuple(candidates[position] for position in sorted(positions))
+
+
 class ProfileStore:
     """Registry for configuration profiles.
 
@@ -374,6 +436,23 @@ class ProfileStore:
                 )
         return tuple(matches)
 
+    def prepare_index(self, tags: Optional[Iterable[str]]) -> ProfileMatchIndex:
+        """Return a :class:`ProfileMatchIndex` for repeated lookups under ``tags``.
+
+        Equivalent to calling :meth:`matching_configs` with the same tags for
+        each path, but the tag filtering is done once up front.
+        """
+
+        tag_set = normalize_tags(tags)
+        return ProfileMatchIndex(
+            [
+                AppliedProfileConfig(profile=profile, config=config)
+                for profile in self.applicable_profiles(tag_set)
+                for config in profile.configs
+                if config._matches_tags(tag_set)
+            ]
+        )
+
     @classmethod
     def from_dict(cls, payload: Mapping[str, Any]) -> "ProfileStore":
         profiles: list[ConfigurationProfile] = []
@@ -555,6 +555,7 @@ class MultiServerRunner:
         drilldown_entries: list[Mapping[str, object]] = []
         hosts_by_id = {plan.host_id: plan for plan in plans}
         total_hosts = len(plans)
+        generated_at = datetime.now(timezone.utc)
 
         for config_id in sorted(config_index.keys()):
             per_host = config_index[config_id]
@@ -599,6 +600,7 @@ class MultiServerRunner:
                         ),
                         baseline_name=baseline_display,
                         comparison_name=record.display_name,
+                        generated_at=generated_at,
                     )
                 )
                 unified_diffs[host_id] = {
@@ -4,11 +4,35 @@ from __future__ import annotations
 
 import argparse
 import json
+import math
+import os
+import posixpath
 import sys
 from pathlib import Path
-from typing import Any, Iterable, Mapping, MutableMapping, Optional, Sequence
+from types import MappingProxyType
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
+
+try:  # pragma: no cover - optional streaming parser
+    import ijson  # type: ignore
+except ImportError:  # pragma: no cover - optional streaming parser
+    ijson = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional fast JSON codec
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional fast JSON codec
+    orjson = None  # type: ignore[assignment]
 
 from .core.profiles import (
+    AppliedProfileConfig,
     ConfigurationProfile,
     ProfileConfig,
     ProfileStore,
@@ -16,85 +40,318 @@ from .core.profiles import (
 )
 
 
+def _json_loads(data: bytes) -> Any:
+    """Parse ``data`` with ``orjson`` when available, else the stdlib codec."""
+
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity and oversized integers need the stdlib parser
+    return json.loads(data)
+
+
 def _load_json(path: Path) -> Mapping[str, Any]:
     """Return JSON payload stored at ``path`` with friendly error handling."""
 
     try:
-        text = path.read_text()
+        data = path.read_bytes()
     except OSError as exc:  # pragma: no cover - manual CLI guard
         raise ValueError(f"Unable to read JSON payload from {path}: {exc}") from exc
     try:
-        return json.loads(text)
-    except json.JSONDecodeError as exc:  # pragma: no cover - defensive guard
+        return _json_loads(data)
+    except ValueError as exc:  # pragma: no cover - defensive guard
         raise ValueError(f"Failed to parse JSON from {path}: {exc}") from exc
 
 
+_HUNT_ARRAY_ERROR = "Hunt payload must be a JSON array of hunt hits."
+
+
+def _iter_hunt_entries(path: Path) -> Iterator[Mapping[str, Any]]:
+    """Yield hunt hits stored at ``path`` one mapping at a time.
+
+    When ``ijson`` is installed the array is streamed so peak memory stays
+    bounded by a single hit; otherwise the payload is parsed in one go.
+    Non-array payloads are rejected before any entry is yielded.
+    """
+
+    if ijson is not None:
+        offset = _ensure_hunt_array(path)
+        return _stream_hunt_entries(path, offset)
+
+    payload = _load_json(path)
+    if not isinstance(payload, Sequence):
+        raise ValueError(_HUNT_ARRAY_ERROR)
+    return (entry for entry in payload if isinstance(entry, Mapping))
+
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+_JSON_WHITESPACE = b" \t\r\n"
+_HUNT_SCAN_CHUNK = 4096
+
+
+def _ensure_hunt_array(path: Path) -> int:
+    """Return the byte offset of the top-level ``[`` in the hunt file.
+
+    A UTF-8 BOM and any amount of leading whitespace are skipped chunk by
+    chunk; anything other than an array start is rejected.
+    """
+
+    try:
+        with path.open("rb") as handle:
+            offset = 0
+            chunk = handle.read(_HUNT_SCAN_CHUNK)
+            if chunk.startswith(_UTF8_BOM):
+                chunk = chunk[len(_UTF8_BOM) :]
+                offset = len(_UTF8_BOM)
+            while chunk:
+                stripped = chunk.lstrip(_JSON_WHITESPACE)
+                offset += len(chunk) - len(stripped)
+                if stripped:
+                    if stripped.startswith(b"["):
+                        return offset
+                    break
+                chunk = handle.read(_HUNT_SCAN_CHUNK)
+    except OSError as exc:
+        raise ValueError(f"Unable to read JSON payload from {path}: {exc}") from exc
+    raise ValueError(_HUNT_ARRAY_ERROR)
+
+
+def _stream_hunt_entries(path: Path, offset: int) -> Iterator[Mapping[str, Any]]:
+    with path.open("rb") as handle:
+        handle.seek(offset)
+        try:
+            for entry in ijson.items(handle, "item", use_float=True):
+                if isinstance(entry, Mapping):
+                    yield entry
+        except ijson.JSONError as exc:
+            raise ValueError(f"Failed to parse JSON from {path}: {exc}") from exc
+
+
+_PROFILE_STORE_FROM_DICT = getattr(ProfileStore, "from_dict", None)
+if not callable(_PROFILE_STORE_FROM_DICT):  # pragma: no cover - older stores
+    _PROFILE_STORE_FROM_DICT = None
+
+
+def _config_from_payload(cfg: Mapping[str, Any]) -> ProfileConfig:
+    return ProfileConfig(
+        identifier=str(cfg["id"]),
+        path=cfg.get("path"),
+        path_glob=cfg.get("path_glob"),
+        application=cfg.get("application"),
+        version=cfg.get("version"),
+        branch=cfg.get("branch"),
+        tags=cfg.get("tags"),
+        expected_format=cfg.get("expected_format"),
+        expected_variant=cfg.get("expected_variant"),
+        metadata=cfg.get("metadata", {}),
+    )
+
+
 def _store_from_payload(payload: Mapping[str, Any]) -> ProfileStore:
     """Return a ProfileStore built from a dictionary payload."""
 
-    builder = getattr(ProfileStore, "from_dict", None)
-    if callable(builder):
+    if _PROFILE_STORE_FROM_DICT is not None:
         try:
-            return builder(payload)  # type: ignore[arg-type]
+            return _PROFILE_STORE_FROM_DICT(payload)  # type: ignore[arg-type]
         except Exception:  # pragma: no cover - fall back to manual build
             pass
 
-    profiles: list[ConfigurationProfile] = []
-    for entry in payload.get("profiles", []):
-        if not isinstance(entry, Mapping):
-            continue
-        configs = []
-        for cfg in entry.get("configs", []):
-            if not isinstance(cfg, Mapping):
-                continue
-            configs.append(
-                ProfileConfig(
-                    identifier=str(cfg["id"]),
-                    path=cfg.get("path"),
-                    path_glob=cfg.get("path_glob"),
-                    application=cfg.get("application"),
-                    version=cfg.get("version"),
-                    branch=cfg.get("branch"),
-                    tags=cfg.get("tags"),
-                    expected_format=cfg.get("expected_format"),
-                    expected_variant=cfg.get("expected_variant"),
-                    metadata=cfg.get("metadata", {}),
-                )
-            )
-        profiles.append(
-            ConfigurationProfile(
-                name=str(entry["name"]),
-                description=entry.get("description"),
-                tags=entry.get("tags"),
-                configs=tuple(configs),
-                metadata=entry.get("metadata", {}),
-            )
+    profiles = [
+        ConfigurationProfile(
+            name=str(entry["name"]),
+            description=entry.get("description"),
+            tags=entry.get("tags"),
+            configs=tuple(
+                _config_from_payload(cfg)
+                for cfg in entry.get("configs", [])
+                if isinstance(cfg, Mapping)
+            ),
+            metadata=entry.get("metadata", {}),
         )
+        for entry in payload.get("profiles", [])
+        if isinstance(entry, Mapping)
+    ]
     return ProfileStore(profiles)
 
 
+_CONTAINER_KINDS: Mapping[type, type] = {
+    dict: dict,
+    MappingProxyType: dict,
+    list: list,
+    tuple: list,
+    set: list,
+    frozenset: list,
+}
+
+
+def _container_kind(value: Any) -> Optional[type]:
+    """Return ``dict``/``list`` for container ``value`` or ``None`` for leaves."""
+
+    kind = _CONTAINER_KINDS.get(type(value))
+    if kind is not None:
+        return kind
+    if isinstance(value, Mapping):
+        return dict
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return list
+    return None
+
+
 def _normalise_payload(payload: Any) -> Any:
-    """Convert mapping proxy/frozen containers to JSON-friendly structures."""
+    """Convert mapping proxy/frozen containers to JSON-friendly structures.
+
+    The payload is walked with an explicit stack so deeply nested summaries
+    neither hit the recursion limit nor pay per-node call overhead.
+    """
+
+    container_kind = _container_kind
+    root_kind = container_kind(payload)
+    if root_kind is None:
+        return payload
+
+    root = root_kind()
+    stack: list[tuple[Any, Any]] = [(payload, root)]
+    while stack:
+        source, target = stack.pop()
+        if type(target) is dict:
+            for key, value in source.items():
+                kind = container_kind(value)
+                if kind is None:
+                    target[key] = value
+                    continue
+                child = kind()
+                target[key] = child
+                stack.append((value, child))
+        else:
+            append = target.append
+            for value in source:
+                kind = container_kind(value)
+                if kind is None:
+                    append(value)
+                    continue
+                child = kind()
+                append(child)
+                stack.append((value, child))
+    return root
+
+
+def _json_default(value: Any) -> Any:
+    """Convert mapping proxies and sets as the encoder reaches them."""
+
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_ORJSON_PLAIN_SCALARS = frozenset({int, bool, type(None)})
+_ORJSON_SEQUENCES = frozenset({list, tuple, set, frozenset})
+
+
+def _orjson_matches_stdlib(payload: Any) -> bool:
+    """Return whether ``orjson`` would encode ``payload`` exactly like ``json``.
+
+    ``orjson`` writes NaN/Infinity as ``null``, leaves non-ASCII text and DEL
+    unescaped, spells exponents differently (``1e16`` vs ``1e+16``) and
+    accepts types the stdlib rejects. Only trees of plain containers with
+    ``str`` keys, ASCII strings and finite floats that Python prints without
+    an exponent are encoded identically.
+    """
+
+    stack = [payload]
+    while stack:
+        value = stack.pop()
+        kind = type(value)
+        if kind is str:
+            if not value.isascii() or "\x7f" in value:
+                return False
+        elif kind in _ORJSON_PLAIN_SCALARS:
+            continue
+        elif kind is float:
+            if not math.isfinite(value) or "e" in repr(value):
+                return False
+        elif kind is dict or kind is MappingProxyType:
+            for key in value:
+                if type(key) is not str:
+                    return False
+            stack.extend(value)
+            stack.extend(value.values())
+        elif kind in _ORJSON_SEQUENCES:
+            stack.extend(value)
+        else:
+            return False
+    return True
+
+
+def _orjson_dumps(payload: Any, *, indent: int, sort_keys: bool) -> Optional[bytes]:
+    """Return ``payload`` encoded by ``orjson`` or ``None`` to use the stdlib.
+
+    ``orjson`` only supports two-space indentation and is only used when its
+    bytes are guaranteed to equal ``json.dump`` output (see
+    :func:`_orjson_matches_stdlib`); everything else, including integers
+    beyond 64 bits, goes through ``json.dump``.
+    """
+
+    if orjson is None or indent != 2 or not _orjson_matches_stdlib(payload):
+        return None
+    option = orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    try:
+        return orjson.dumps(payload, default=_json_default, option=option)
+    except TypeError:
+        return None
 
-    if isinstance(payload, Mapping):
-        return {key: _normalise_payload(value) for key, value in payload.items()}
-    if isinstance(payload, (list, tuple, set, frozenset)):
-        return [_normalise_payload(value) for value in payload]
-    return payload
+
+def _stream_json(
+    stream: TextIO,
+    payload: Any,
+    encoded: Optional[bytes],
+    *,
+    indent: int,
+    sort_keys: bool,
+) -> None:
+    if encoded is not None:
+        # ``orjson`` output is pure ASCII here, so it goes through the text
+        # layer exactly like ``json.dump`` output would.
+        stream.write(encoded.decode("ascii"))
+    else:
+        json.dump(
+            payload,
+            stream,
+            indent=None if indent <= 0 else indent,
+            sort_keys=sort_keys,
+            default=_json_default,
+        )
+    stream.write("\n")
 
 
 def _write_json(payload: Mapping[str, Any], *, output: Path | None, indent: int, sort_keys: bool) -> None:
-    """Serialise ``payload`` to JSON writing to ``output`` (or STDOUT)."""
-
-    serialisable = _normalise_payload(payload)
-    json_kwargs: MutableMapping[str, Any] = {"sort_keys": sort_keys}
-    json_kwargs["indent"] = None if indent <= 0 else indent
-    text = json.dumps(serialisable, **json_kwargs)
-    suffix = "\n" if not text.endswith("\n") else ""
+    """Serialise ``payload`` to JSON writing to ``output`` (or STDOUT).
+
+    The document is streamed to the destination instead of being assembled as
+    one string first; ``orjson`` encodes payloads it renders byte-for-byte
+    like the stdlib and ``json.dump`` writes the rest chunk by chunk. Mapping
+    proxies and frozen sets are converted by ``_json_default`` during
+    encoding, so plain payloads are never copied. File output is streamed to
+    a sibling temporary file that replaces ``output`` only once encoding has
+    finished, so a failure never leaves a truncated document behind.
+    """
+
+    encoded = _orjson_dumps(payload, indent=indent, sort_keys=sort_keys)
     if output is None:
-        sys.stdout.write(text + suffix)
-    else:
-        output.write_text(text + suffix)
+        _stream_json(sys.stdout, payload, encoded, indent=indent, sort_keys=sort_keys)
+        return
+    staging = output.with_name(f".{output.name}.{os.getpid()}.tmp")
+    try:
+        with staging.open("w", encoding="utf-8") as handle:
+            _stream_json(handle, payload, encoded, indent=indent, sort_keys=sort_keys)
+        os.replace(staging, output)
+    except BaseException:
+        staging.unlink(missing_ok=True)
+        raise
 
 
 def _add_output_options(parser: argparse.ArgumentParser) -> None:
@@ -116,10 +373,44 @@ def _add_output_options(parser: argparse.ArgumentParser) -> None:
     )
 
 
+# ``Path.relative_to`` ignores case on Windows, so root matching does too.
+_CASE_INSENSITIVE_PATHS = os.name == "nt"
+
+
+def _root_prefix(root: Optional[Path]) -> Optional[str]:
+    """Return ``root`` as a normalised POSIX string for prefix matching."""
+
+    if root is None:
+        return None
+    return posixpath.normpath(root.as_posix())
+
+
+def _strip_root(path: str, root: str) -> Optional[str]:
+    """Return ``path`` relative to ``root`` (both normalised) or ``None``."""
+
+    if root == ".":
+        return None if path.startswith("/") else path
+    size = len(root)
+    head = path[:size]
+    if _CASE_INSENSITIVE_PATHS:
+        matched = head.casefold() == root.casefold()
+    else:
+        matched = head == root
+    if not matched:
+        return None
+    if len(path) == size:
+        return "."
+    if root.endswith("/"):
+        return path[size:]
+    if path[size] == "/":
+        return path[size + 1 :]
+    return None
+
+
 def _resolve_relative_path(
     entry: Mapping[str, Any],
     *,
-    root: Optional[Path],
+    root_prefix: Optional[str],
 ) -> Optional[str]:
     relative = entry.get("relative_path")
     if isinstance(relative, str) and relative:
@@ -129,14 +420,12 @@ def _resolve_relative_path(
     if not isinstance(path_text, str) or not path_text:
         return None
 
-    path = Path(path_text)
-    if root is None:
-        return path.name
-
-    try:
-        return path.relative_to(root).as_posix()
-    except ValueError:
-        return path.name
+    posix_text = posixpath.normpath(path_text.replace("\\", "/"))
+    if root_prefix is not None:
+        stripped = _strip_root(posix_text, root_prefix)
+        if stripped is not None:
+            return stripped
+    return posixpath.basename(posix_text)
 
 
 def _build_bridge_payload(
@@ -147,23 +436,41 @@ def _build_bridge_payload(
     root: Optional[Path],
 ) -> Mapping[str, Any]:
     items = []
+    # Tags are fixed for the whole run, so tag filtering happens once in the
+    # index and hunts reporting many hits per file reuse the cached matches.
+    index = store.prepare_index(tags)
+    match_cache: dict[Optional[str], Tuple[AppliedProfileConfig, ...]] = {}
+    root_prefix = _root_prefix(root)
+    # Profile names are unique within a store, so their sorted tags can be
+    # reused across every hit that matches the same profile.
+    sorted_tags: dict[str, Tuple[str, ...]] = {}
     for entry in hunts:
-        relative = _resolve_relative_path(entry, root=root)
-        matches = store.matching_configs(tags, relative_path=relative)
+        relative = _resolve_relative_path(entry, root_prefix=root_prefix)
+        matches = match_cache.get(relative)
+        if matches is None:
+            matches = index.match(relative)
+            match_cache[relative] = matches
+        profiles = []
+        for match in matches:
+            profile = match.profile
+            profile_tags = sorted_tags.get(profile.name)
+            if profile_tags is None:
+                profile_tags = tuple(sorted(profile.tags))
+                sorted_tags[profile.name] = profile_tags
+            profiles.append(
+                {
+                    "profile": profile.name,
+                    "config": match.config.identifier,
+                    "profile_tags": list(profile_tags),
+                    "expected_format": match.config.expected_format,
+                    "expected_variant": match.config.expected_variant,
+                }
+            )
         items.append(
             {
                 "hunt": _normalise_payload(entry),
                 "relative_path": relative,
-                "profiles": [
-                    {
-                        "profile": match.profile.name,
-                        "config": match.config.identifier,
-                        "profile_tags": sorted(match.profile.tags),
-                        "expected_format": match.config.expected_format,
-                        "expected_variant": match.config.expected_variant,
-                    }
-                    for match in matches
-                ],
+                "profiles": profiles,
             }
         )
     return {"items": items}
@@ -187,15 +494,12 @@ def _handle_diff(args: argparse.Namespace) -> int:
 
 def _handle_hunt_bridge(args: argparse.Namespace) -> int:
     store_payload = _load_json(args.store)
-    hunts_payload = _load_json(args.hunt)
-
-    if not isinstance(hunts_payload, Sequence):
-        raise ValueError("Hunt payload must be a JSON array of hunt hits.")
+    hunts = _iter_hunt_entries(args.hunt)
 
     store = _store_from_payload(store_payload)
     bridge = _build_bridge_payload(
         store,
-        (entry for entry in hunts_payload if isinstance(entry, Mapping)),
+        hunts,
         tags=args.tags,
         root=args.root,
     )
@@ -9,50 +9,56 @@ platforms.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from functools import wraps
+import importlib
+import os
 import time
-from typing import Callable, Dict, Mapping, Tuple, TypeVar, cast
-import re
-
-from .scan import (
-    is_windows,
-    RegistryApp,
-    RegistryHit,
-    SearchSpec,
-    enumerate_installed_apps as _enumerate_installed_apps,
-    find_app_registry_roots as _find_app_registry_roots,
-    search_registry as _search_registry,
-)
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Mapping, Tuple, TypeVar, cast
+
+if TYPE_CHECKING:  # pragma: no cover - import only for type hints
+    from .scan import (
+        is_windows,
+        RegistryApp,
+        RegistryHit,
+        SearchSpec,
+        enumerate_installed_apps,
+        find_app_registry_roots,
+        iter_search_registry,
+        search_registry,
+    )
 
 _Operation = TypeVar("_Operation", bound=Callable[..., object])
 
 
-@dataclass
+@dataclass(slots=True)
 class _UsageCounters:
-    """Mutable usage counters for a registry operation."""
+    """Mutable usage counters for a registry operation.
+
+    Durations and timestamps are kept as integer nanoseconds so the hot
+    wrapper only does integer arithmetic; conversion happens in ``snapshot``.
+    """
 
     calls: int = 0
     successes: int = 0
     errors: int = 0
-    total_duration: float = 0.0
-    last_duration: float | None = None
+    total_duration_ns: int = 0
+    last_duration_ns: int | None = None
     last_error: str | None = None
-    first_invocation: float | None = None
-    last_invocation: float | None = None
+    first_invocation_ns: int | None = None
+    last_invocation_ns: int | None = None
 
     def snapshot(self, name: str) -> Mapping[str, object]:
-        avg_duration = self.total_duration / self.successes if self.successes else 0.0
+        avg_duration_ns = self.total_duration_ns / self.successes if self.successes else 0.0
         return {
             "operation": name,
             "calls": self.calls,
             "successes": self.successes,
             "errors": self.errors,
-            "total_duration_ms": round(self.total_duration * 1000, 3),
-            "avg_duration_ms": round(avg_duration * 1000, 3),
-            "last_duration_ms": round((self.last_duration or 0.0) * 1000, 3),
-            "first_invocation": _format_timestamp(self.first_invocation),
-            "last_invocation": _format_timestamp(self.last_invocation),
+            "total_duration_ms": round(self.total_duration_ns / 1e6, 3),
+            "avg_duration_ms": round(avg_duration_ns / 1e6, 3),
+            "last_duration_ms": round((self.last_duration_ns or 0) / 1e6, 3),
+            "first_invocation": _format_timestamp(self.first_invocation_ns),
+            "last_invocation": _format_timestamp(self.last_invocation_ns),
             "last_error": self.last_error,
         }
 
@@ -60,17 +66,28 @@ class _UsageCounters:
         self.calls = 0
         self.successes = 0
         self.errors = 0
-        self.total_duration = 0.0
-        self.last_duration = None
+        self.total_duration_ns = 0
+        self.last_duration_ns = None
         self.last_error = None
-        self.first_invocation = None
-        self.last_invocation = None
+        self.first_invocation_ns = None
+        self.last_invocation_ns = None
+
+
+def _format_timestamp(value_ns: int | None) -> str | None:
+    """Return ``value_ns`` as an ISO-8601 UTC string with a ``Z`` suffix.
 
+    Matches ``datetime.isoformat`` output (fraction omitted when zero) without
+    building a ``datetime``.
+    """
 
-def _format_timestamp(value: float | None) -> str | None:
-    if value is None:
+    if value_ns is None:
         return None
-    return datetime.fromtimestamp(value, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+    seconds, remainder_ns = divmod(value_ns, 1_000_000_000)
+    text = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+    micros = remainder_ns // 1000
+    if micros:
+        return f"{text}.{micros:06d}Z"
+    return f"{text}Z"
 
 
 _OPERATIONS = (
@@ -81,6 +98,31 @@ _OPERATIONS = (
 
 _USAGE: Dict[str, _UsageCounters] = {name: _UsageCounters() for name in _OPERATIONS}
 
+PROFILE_ENV = "DRIFTBUSTER_REGISTRY_PROFILE"
+
+# Usage tracking stays off until someone asks for it (env var or explicit
+# enable) so unmeasured scans skip the timer reads entirely.
+_INSTRUMENTATION_ENABLED = os.environ.get(PROFILE_ENV, "").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+
+
+def enable_registry_profiling() -> None:
+    """Start recording usage counters for the live registry operations."""
+
+    global _INSTRUMENTATION_ENABLED
+    _INSTRUMENTATION_ENABLED = True
+
+
+def disable_registry_profiling() -> None:
+    """Stop recording usage counters; existing counters are kept."""
+
+    global _INSTRUMENTATION_ENABLED
+    _INSTRUMENTATION_ENABLED = False
+
 
 @dataclass(frozen=True)
 class RegistryRoot:
@@ -94,7 +136,7 @@ class RegistryRoot:
         return self.hive, self.path, self.view
 
 
-_ROOT_DESCRIPTOR_RE = re.compile(r"^(HKLM|HKCU)\\(.+)$", re.IGNORECASE)
+_ROOT_DESCRIPTOR_PREFIXES = ("HKLM\\", "HKCU\\")
 
 
 def parse_registry_root_descriptor(text: str) -> RegistryRoot:
@@ -106,14 +148,15 @@ def parse_registry_root_descriptor(text: str) -> RegistryRoot:
 
     segments = [segment.strip() for segment in value.split(",") if segment.strip()]
     base = segments[0].replace("/", "\\")
-    match = _ROOT_DESCRIPTOR_RE.match(base)
-    if not match:
+    prefix = base[:5].upper()
+    remainder = base[5:]
+    if prefix not in _ROOT_DESCRIPTOR_PREFIXES or not remainder:
         raise ValueError(
             "Registry root descriptor must start with HKLM\\ or HKCU\\"
         )
 
-    hive = match.group(1).upper()
-    path = match.group(2).strip()
+    hive = prefix[:4]
+    path = remainder.strip()
     if not path:
         raise ValueError("Registry root path segment must be non-empty")
 
@@ -141,54 +184,128 @@ def parse_registry_root_descriptor(text: str) -> RegistryRoot:
     return RegistryRoot(hive=hive, path=path, view=view)
 
 
+def _record_start(counters: _UsageCounters) -> None:
+    # Durations use the monotonic counter; timestamps read the wall clock so
+    # they stay correct across suspends and clock adjustments.
+    invoked = time.time_ns()
+    counters.calls += 1
+    if counters.first_invocation_ns is None:
+        counters.first_invocation_ns = invoked
+    counters.last_invocation_ns = invoked
+
+
+def _record_end(counters: _UsageCounters, duration: int, error: Exception | None) -> None:
+    counters.total_duration_ns += duration
+    counters.last_duration_ns = duration
+    if error is not None:
+        counters.errors += 1
+        counters.last_error = f"{error.__class__.__name__}: {error}"
+    else:
+        counters.successes += 1
+        counters.last_error = None
+
+
 def _instrument(name: str, func: _Operation) -> _Operation:
     counters = _USAGE[name]
+    perf_counter_ns = time.perf_counter_ns
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        counters.calls += 1
-        now = time.time()
-        if counters.first_invocation is None:
-            counters.first_invocation = now
-        counters.last_invocation = now
-        start = time.perf_counter()
+        if not _INSTRUMENTATION_ENABLED:
+            return func(*args, **kwargs)
+        _record_start(counters)
+        start = perf_counter_ns()
         try:
             result = func(*args, **kwargs)
         except Exception as exc:
-            counters.errors += 1
-            duration = time.perf_counter() - start
-            counters.total_duration += duration
-            counters.last_duration = duration
-            counters.last_error = f"{exc.__class__.__name__}: {exc}"
+            _record_end(counters, perf_counter_ns() - start, exc)
             raise
-        else:
-            duration = time.perf_counter() - start
-            counters.successes += 1
-            counters.total_duration += duration
-            counters.last_duration = duration
-            counters.last_error = None
-            return result
+        _record_end(counters, perf_counter_ns() - start, None)
+        return result
 
     return cast(_Operation, wrapper)
 
 
-enumerate_installed_apps = _instrument(
-    "enumerate_installed_apps", _enumerate_installed_apps
-)
-find_app_registry_roots = _instrument(
-    "find_app_registry_roots", _find_app_registry_roots
+def _instrument_iter(name: str, func: _Operation) -> _Operation:
+    """Wrap generator ``func`` so its runs count towards ``name``.
+
+    A run is recorded once the generator is exhausted, fails, or is closed
+    early by the consumer; only time spent producing items is measured, so
+    callers printing results as they stream do not inflate the duration.
+    """
+
+    counters = _USAGE[name]
+    perf_counter_ns = time.perf_counter_ns
+
+    def _measured(iterator: Iterator[object]) -> Iterator[object]:
+        _record_start(counters)
+        elapsed = 0
+        error: Exception | None = None
+        try:
+            while True:
+                start = perf_counter_ns()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    elapsed += perf_counter_ns() - start
+                    return
+                except Exception as exc:
+                    elapsed += perf_counter_ns() - start
+                    error = exc
+                    raise
+                elapsed += perf_counter_ns() - start
+                yield item
+        finally:
+            _record_end(counters, elapsed, error)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _INSTRUMENTATION_ENABLED:
+            return func(*args, **kwargs)
+        return _measured(iter(func(*args, **kwargs)))
+
+    return cast(_Operation, wrapper)
+
+
+_SCAN_EXPORTS = frozenset(
+    {"is_windows", "RegistryApp", "RegistryHit", "SearchSpec", "iter_search_registry"}
 )
-search_registry = _instrument("search_registry", _search_registry)
+
+# Streaming variants report into the counters of their eager counterpart.
+_ITERATOR_OPERATIONS = {"iter_search_registry": "search_registry"}
+
+
+def __getattr__(name: str):
+    """Import ``scan`` on first use so root parsing stays import-light.
+
+    The live operations are wrapped with ``_instrument`` (streaming ones with
+    ``_instrument_iter``) at that point and, like the plain re-exports,
+    cached in module globals for later lookups.
+    """
+
+    if name not in _USAGE and name not in _SCAN_EXPORTS:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    scan = importlib.import_module(".scan", __name__)
+    value = getattr(scan, name)
+    if name in _USAGE:
+        value = _instrument(name, value)
+    elif name in _ITERATOR_OPERATIONS:
+        value = _instrument_iter(_ITERATOR_OPERATIONS[name], value)
+    globals()[name] = value
+    return value
 
 
 def registry_summary(*, reset: bool = False) -> Tuple[Mapping[str, object], ...]:
     """Return usage statistics for the live registry operations.
 
+    Counters only move while tracking is on, via ``DRIFTBUSTER_REGISTRY_PROFILE``
+    or ``enable_registry_profiling``; calling this does not switch it on.
+
     Args:
         reset: When ``True`` counters are cleared after creating the snapshot.
     """
 
-    snapshot = tuple(_USAGE[name].snapshot(name) for name in _OPERATIONS)
+    snapshot = tuple(counters.snapshot(name) for name, counters in _USAGE.items())
     if reset:
         for counters in _USAGE.values():
             counters.reset()
@@ -203,8 +320,11 @@ __all__ = [
     "SearchSpec",
     "enumerate_installed_apps",
     "find_app_registry_roots",
+    "iter_search_registry",
     "search_registry",
     "registry_summary",
+    "enable_registry_profiling",
+    "disable_registry_profiling",
     "parse_registry_root_descriptor",
 ]
 
@@ -1,17 +1,32 @@
 from __future__ import annotations
 
 import sys
+import threading
 import time
 import re
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from functools import lru_cache
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - optional visited-set filter
+    from pybloom_live import ScalableBloomFilter  # type: ignore
+except ImportError:  # pragma: no cover - optional visited-set filter
+    ScalableBloomFilter = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional keyword automaton
+    import ahocorasick  # type: ignore
+except ImportError:  # pragma: no cover - optional keyword automaton
+    ahocorasick = None  # type: ignore[assignment]
 
 
 def is_windows() -> bool:
     return sys.platform.startswith("win32") or sys.platform.startswith("cygwin")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegistryApp:
     display_name: str
     key_path: str
@@ -23,7 +38,7 @@ class RegistryApp:
     view: str = "auto"  # "32" | "64" | "auto"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegistryHit:
     path: str
     hive: str
@@ -39,6 +54,9 @@ class SearchSpec:
     max_depth: int = 12
     max_hits: int = 200
     time_budget_s: float = 10.0
+    strategy: str = "dfs"  # "dfs" | "bfs"
+    prune: bool = False
+    approximate_visited: bool = False  # Bloom-filter visited set (pybloom_live)
 
 
 class _Backend:
@@ -68,6 +86,14 @@ class _WinRegBackend(_Backend):
             access |= getattr(reg, "KEY_WOW64_32KEY", 0)
         return reg.OpenKeyEx(self._hives[hive], path, 0, access)
 
+    def key_exists(self, hive: str, path: str, view: Optional[str]) -> bool:  # pragma: no cover - integration on Windows only
+        try:
+            handle = self._open(hive, path, view)
+        except OSError:
+            return False
+        self._reg.CloseKey(handle)
+        return True
+
     def enum_subkeys(self, hive: str, path: str, view: Optional[str]) -> List[str]:  # pragma: no cover - integration on Windows only
         reg = self._reg
         try:
@@ -88,7 +114,7 @@ class _WinRegBackend(_Backend):
             reg.CloseKey(handle)
         return results
 
-    def enum_values(self, hive: str, path: str, view: Optional[str]) -> List[Tuple[str, object]]:  # pragma: no cover - integration on Windows only
+    def enum_values(self, hive: str, path: str, view: Optional[str]) -> List[Tuple[str, object]]:  # pragma: no cover - Windows only
         reg = self._reg
         try:
             handle = self._open(hive, path, view)
@@ -109,64 +135,346 @@ class _WinRegBackend(_Backend):
         return results
 
 
+_REG_SZ = 1
+_REG_EXPAND_SZ = 2
+_REG_DWORD = 4
+_REG_MULTI_SZ = 7
+_REG_QWORD = 11
+_ERROR_SUCCESS = 0
+_ERROR_MORE_DATA = 234
+
+
+def _decode_reg_value(kind: int, raw: bytes) -> object:
+    """Decode raw value bytes the way ``winreg.EnumValue`` does for common types."""
+
+    if kind in (_REG_SZ, _REG_EXPAND_SZ):
+        return raw.decode("utf-16-le", errors="replace").split("\0", 1)[0]
+    if kind == _REG_MULTI_SZ:
+        return [item for item in raw.decode("utf-16-le", errors="replace").split("\0") if item]
+    if kind == _REG_DWORD:
+        return int.from_bytes(raw[:4], "little")
+    if kind == _REG_QWORD:
+        return int.from_bytes(raw[:8], "little")
+    # winreg reports empty REG_BINARY/REG_NONE data as None rather than b"".
+    return raw or None
+
+
+class _CtypesBackend(_WinRegBackend):
+    """Enumerate keys through ``advapi32`` with buffers sized once per key.
+
+    ``RegQueryInfoKeyW`` reports the longest subkey/value name and data size,
+    so a single buffer per key serves every ``RegEnum*`` call instead of
+    ``winreg`` allocating per index. Keys are still opened through ``winreg``;
+    each thread keeps its last handle and buffers for reuse until ``close``.
+    """
+
+    def __init__(self) -> None:  # pragma: no cover - exercised in integration only
+        super().__init__()
+        import ctypes
+        from ctypes import wintypes
+
+        self._ctypes = ctypes
+        self._wintypes = wintypes
+        self._local = threading.local()
+        advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
+        dword_p = ctypes.POINTER(wintypes.DWORD)
+        self._query_info = advapi32.RegQueryInfoKeyW
+        self._query_info.argtypes = [
+            wintypes.HKEY, wintypes.LPWSTR, dword_p, dword_p,
+            dword_p, dword_p, dword_p, dword_p, dword_p, dword_p, dword_p, ctypes.c_void_p,
+        ]
+        self._query_info.restype = wintypes.LONG
+        self._enum_key = advapi32.RegEnumKeyExW
+        self._enum_key.argtypes = [
+            wintypes.HKEY, wintypes.DWORD, wintypes.LPWSTR, dword_p,
+            dword_p, wintypes.LPWSTR, dword_p, ctypes.c_void_p,
+        ]
+        self._enum_key.restype = wintypes.LONG
+        self._enum_value = advapi32.RegEnumValueW
+        self._enum_value.argtypes = [
+            wintypes.HKEY, wintypes.DWORD, wintypes.LPWSTR, dword_p,
+            dword_p, dword_p, ctypes.c_void_p, dword_p,
+        ]
+        self._enum_value.restype = wintypes.LONG
+
+    def _info(self, handle) -> Optional[Tuple[int, int, int, int, int]]:  # pragma: no cover - integration on Windows only
+        DWORD = self._wintypes.DWORD
+        byref = self._ctypes.byref
+        subkeys, max_subkey, values, max_name, max_data = DWORD(), DWORD(), DWORD(), DWORD(), DWORD()
+        status = self._query_info(
+            int(handle), None, None, None,
+            byref(subkeys), byref(max_subkey), None,
+            byref(values), byref(max_name), byref(max_data), None, None,
+        )
+        if status != _ERROR_SUCCESS:
+            return None
+        return subkeys.value, max_subkey.value, values.value, max_name.value, max_data.value
+
+    def _handle(self, hive: str, path: str, view: Optional[str]):  # pragma: no cover - integration on Windows only
+        # Searches list a key's values and then its subkeys, so keep the most
+        # recent handle open per thread instead of reopening the same key.
+        key = (hive, path, view)
+        slot = getattr(self._local, "handle", None)
+        if slot is not None and slot[0] == key:
+            return slot[1]
+        self.close()
+        handle = self._open(hive, path, view)
+        self._local.handle = (key, handle)
+        return handle
+
+    def close(self) -> None:  # pragma: no cover - integration on Windows only
+        """Close the handle kept open for the calling thread, if any."""
+
+        slot = getattr(self._local, "handle", None)
+        if slot is not None:
+            self._local.handle = None
+            self._reg.CloseKey(slot[1])
+
+    def _buffer(self, attr: str, size: int, factory: Callable[[int], object]):  # pragma: no cover - integration on Windows only
+        # Per-thread enumeration buffers only ever grow, so most keys reuse the
+        # buffer allocated for an earlier, larger key.
+        buffer = getattr(self._local, attr, None)
+        if buffer is None or len(buffer) < size:
+            buffer = factory(size)
+            setattr(self._local, attr, buffer)
+        return buffer
+
+    def enum_subkeys(self, hive: str, path: str, view: Optional[str]) -> List[str]:  # pragma: no cover - integration on Windows only
+        try:
+            handle = self._handle(hive, path, view)
+        except OSError:
+            return []
+        info = self._info(handle)
+        if info is None:
+            return super().enum_subkeys(hive, path, view)
+        count, max_len = info[0], info[1]
+        buffer = self._buffer("names", max_len + 1, self._ctypes.create_unicode_buffer)
+        size = self._wintypes.DWORD()
+        results: List[str] = []
+        for index in range(count):
+            size.value = len(buffer)
+            status = self._enum_key(int(handle), index, buffer, self._ctypes.byref(size), None, None, None, None)
+            if status != _ERROR_SUCCESS:
+                break
+            results.append(buffer.value[: size.value])
+        return results
+
+    def enum_values(self, hive: str, path: str, view: Optional[str]) -> List[Tuple[str, object]]:  # pragma: no cover - Windows only
+        try:
+            handle = self._handle(hive, path, view)
+        except OSError:
+            return []
+        info = self._info(handle)
+        if info is None:
+            return super().enum_values(hive, path, view)
+        count, max_name, max_data = info[2], info[3], info[4]
+        ctypes = self._ctypes
+        DWORD = self._wintypes.DWORD
+        name_buffer = self._buffer("names", max_name + 1, ctypes.create_unicode_buffer)
+        data_buffer = self._buffer("data", max(max_data, 1), ctypes.create_string_buffer)
+        name_size, data_size, kind = DWORD(), DWORD(), DWORD()
+        results: List[Tuple[str, object]] = []
+        for index in range(count):
+            name_size.value = len(name_buffer)
+            data_size.value = len(data_buffer)
+            status = self._enum_value(
+                int(handle), index, name_buffer, ctypes.byref(name_size), None,
+                ctypes.byref(kind), data_buffer, ctypes.byref(data_size),
+            )
+            if status == _ERROR_MORE_DATA:
+                # Data grew after RegQueryInfoKeyW; resize once and retry.
+                data_buffer = self._buffer("data", data_size.value, ctypes.create_string_buffer)
+                name_size.value = len(name_buffer)
+                data_size.value = len(data_buffer)
+                status = self._enum_value(
+                    int(handle), index, name_buffer, ctypes.byref(name_size), None,
+                    ctypes.byref(kind), data_buffer, ctypes.byref(data_size),
+                )
+            if status != _ERROR_SUCCESS:
+                break
+            # RegEnumValueW has already filled data_buffer, so decode it here
+            # rather than paying for a second RegQueryValueExW per value.
+            name = name_buffer.value[: name_size.value]
+            raw = ctypes.string_at(data_buffer, data_size.value)
+            results.append((name, _decode_reg_value(kind.value, raw)))
+        return results
+
+
+def _native_backend() -> _Backend:  # pragma: no cover - Windows only
+    try:
+        return _CtypesBackend()
+    except (AttributeError, ImportError, OSError):
+        return _WinRegBackend()
+
+
+_KeyId = Tuple[str, str, Optional[str]]
+
+
+class _CachedBackend(_Backend):
+    """Memoise enumerations of ``inner`` keyed on ``(hive, path, view)``.
+
+    Entries expire after ``ttl_s`` seconds so long-lived processes notice
+    registry changes, and the least recently used entries are evicted once
+    ``maxsize`` keys are cached per enumeration kind.
+    """
+
+    def __init__(
+        self,
+        inner: _Backend,
+        *,
+        ttl_s: float = 30.0,
+        maxsize: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._inner = inner
+        self._ttl_s = ttl_s
+        self._maxsize = maxsize
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._subkeys: OrderedDict[_KeyId, Tuple[float, tuple]] = OrderedDict()
+        self._values: OrderedDict[_KeyId, Tuple[float, tuple]] = OrderedDict()
+
+    def _lookup(
+        self,
+        cache: OrderedDict[_KeyId, Tuple[float, tuple]],
+        key: _KeyId,
+        load: Callable[[], Iterable],
+    ) -> tuple:
+        now = self._clock()
+        with self._lock:
+            entry = cache.get(key)
+            if entry is not None and entry[0] > now:
+                cache.move_to_end(key)
+                return entry[1]
+        result = tuple(load())
+        with self._lock:
+            cache[key] = (now + self._ttl_s, result)
+            cache.move_to_end(key)
+            while len(cache) > self._maxsize:
+                cache.popitem(last=False)
+        return result
+
+    def enum_subkeys(self, hive: str, path: str, view: Optional[str]) -> List[str]:
+        key = (hive, path, view)
+        return list(self._lookup(self._subkeys, key, lambda: self._inner.enum_subkeys(hive, path, view)))
+
+    def enum_values(self, hive: str, path: str, view: Optional[str]) -> List[Tuple[str, object]]:
+        key = (hive, path, view)
+        return list(self._lookup(self._values, key, lambda: self._inner.enum_values(hive, path, view)))
+
+    def key_exists(self, hive: str, path: str, view: Optional[str]) -> bool:
+        return _key_exists(self._inner, (hive, path, view))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._subkeys.clear()
+            self._values.clear()
+
+
+_DEFAULT_BACKEND: Optional[_CachedBackend] = None
+
+
 def _default_backend() -> _Backend:
+    """Return the shared cached winreg backend.
+
+    Reusing one instance lets ``enumerate_installed_apps`` and
+    ``search_registry`` calls in the same process share key listings.
+    """
+
+    global _DEFAULT_BACKEND
     if not is_windows():
         raise RuntimeError("Windows Registry scanning requires Windows platform")
-    return _WinRegBackend()
+    if _DEFAULT_BACKEND is None:  # pragma: no cover - Windows only
+        _DEFAULT_BACKEND = _CachedBackend(_native_backend())
+    return _DEFAULT_BACKEND  # pragma: no cover - Windows only
+
 
+_ENUMERATE_WORKERS = 8
+_HIVE_SORT_RANK = {"HKCU": 0, "HKLM": 1}
 
 _UNINSTALL_PATH = r"Software\Microsoft\Windows\CurrentVersion\Uninstall"
 _UNINSTALL_PATH_WOW64 = r"Software\Wow6432Node\Microsoft\Windows\CurrentVersion\Uninstall"
 
 
+@contextmanager
+def _backend_map(parallel: bool) -> Iterator[Callable[..., Iterator]]:
+    """Yield an order-preserving ``map`` for fanning out backend reads.
+
+    Only the built-in backend is known to be thread-safe, so reads through a
+    caller-supplied backend stay on the calling thread.
+    """
+
+    if not parallel:
+        yield map
+        return
+    with ThreadPoolExecutor(max_workers=_ENUMERATE_WORKERS) as executor:
+        yield executor.map
+
+
 def enumerate_installed_apps(*, backend: Optional[_Backend] = None) -> Tuple[RegistryApp, ...]:
     """Enumerate installed applications via Uninstall registry keys.
 
+    Keys are read on a thread pool only through the built-in backend; an
+    explicit ``backend`` is read sequentially on the calling thread.
+
     Returns:
         Ordered tuples of RegistryApp entries collected from HKLM/HKCU, both 64
         and 32-bit views when available.
     """
 
+    parallel = backend is None
     if backend is None:
         backend = _default_backend()
 
-    apps: List[RegistryApp] = []
     # Probe both hives and both views.
     probes = (
         ("HKLM", _UNINSTALL_PATH, "64"),
         ("HKLM", _UNINSTALL_PATH_WOW64, "32"),
         ("HKCU", _UNINSTALL_PATH, None),
     )
-    for hive, base, view in probes:
-        for subkey in backend.enum_subkeys(hive, base, view):
-            key_path = f"{base}\\{subkey}"
-            values = dict((name, data) for name, data in backend.enum_values(hive, key_path, view))
-            display_name = str(values.get("DisplayName") or "").strip()
-            if not display_name:
-                continue
-            app = RegistryApp(
-                display_name=display_name,
-                key_path=key_path,
-                hive=hive,
-                publisher=(str(values.get("Publisher")) if values.get("Publisher") else None),
-                version=(str(values.get("DisplayVersion")) if values.get("DisplayVersion") else None),
-                uninstall_string=(str(values.get("UninstallString")) if values.get("UninstallString") else None),
-                install_location=(str(values.get("InstallLocation")) if values.get("InstallLocation") else None),
-                view=view or "auto",
-            )
-            apps.append(app)
-    # De-duplicate by (hive, key_path) keeping first seen entry
-    seen: set[Tuple[str, str]] = set()
-    unique: List[RegistryApp] = []
-    for app in apps:
-        k = (app.hive, app.key_path)
-        if k in seen:
+    # Registry reads release the GIL, so the built-in backend fans the probes
+    # and the per-app value reads out over a thread pool. ``map`` keeps
+    # submission order, which the first-seen dedupe below relies on.
+    with _backend_map(parallel) as mapper:
+        subkey_lists = list(mapper(lambda probe: backend.enum_subkeys(*probe), probes))
+        keys = [
+            (hive, f"{base}\\{subkey}", view)
+            for (hive, base, view), subkeys in zip(probes, subkey_lists)
+            for subkey in subkeys
+        ]
+        value_lists = list(mapper(lambda key: backend.enum_values(*key), keys))
+
+    # Keyed on (hive, key_path) so the first-seen entry wins in a single pass.
+    unique: Dict[Tuple[str, str], RegistryApp] = {}
+    for (hive, key_path, view), value_list in zip(keys, value_lists):
+        if (hive, key_path) in unique:
             continue
-        seen.add(k)
-        unique.append(app)
-    # Sort by display_name for stable UX
-    unique.sort(key=lambda a: (a.display_name.lower(), a.hive))
-    return tuple(unique)
+        values = dict(value_list)
+        display_name = str(values.get("DisplayName") or "").strip()
+        if not display_name:
+            continue
+        unique[(hive, key_path)] = RegistryApp(
+            display_name=display_name,
+            key_path=key_path,
+            hive=hive,
+            publisher=(str(values.get("Publisher")) if values.get("Publisher") else None),
+            version=(str(values.get("DisplayVersion")) if values.get("DisplayVersion") else None),
+            uninstall_string=(str(values.get("UninstallString")) if values.get("UninstallString") else None),
+            install_location=(str(values.get("InstallLocation")) if values.get("InstallLocation") else None),
+            view=view or "auto",
+        )
+    # Sort by display_name for stable UX; ``sorted`` computes each key once,
+    # and the integer hive rank keeps the previous HKCU-before-HKLM tie order.
+    return tuple(sorted(unique.values(), key=lambda a: (a.display_name.lower(), _HIVE_SORT_RANK[a.hive])))
+
+
+def _key_exists(backend: _Backend, key: _KeyId) -> bool:
+    # winreg-backed backends open the key directly; other backends only need
+    # the two enumeration methods, so fall back to "has any content".
+    probe = getattr(backend, "key_exists", None)
+    if probe is not None:
+        return bool(probe(*key))
+    return bool(backend.enum_subkeys(*key) or backend.enum_values(*key))
 
 
 def _candidate_vendor_app_pairs(app_name: str) -> List[Tuple[str, str]]:
@@ -184,9 +492,15 @@ def find_app_registry_roots(
     app_token: str,
     *,
     installed: Optional[Sequence[RegistryApp]] = None,
+    validate: bool = False,
+    backend: Optional[_Backend] = None,
 ) -> Tuple[Tuple[str, str, Optional[str]], ...]:
     """Guess likely registry roots for a given app token.
 
+    With ``validate=True`` candidates are probed through ``backend`` (the
+    default backend, on a thread pool, when omitted) and keys that cannot be
+    opened are dropped, so searches do not pay for roots that do not exist.
+
     Returns:
         Tuples of (hive, path, view) suitable for searching.
     """
@@ -233,83 +547,285 @@ def find_app_registry_roots(
             continue
         seen_paths.add(item)
         ordered.append(item)
-    return tuple(ordered)
+    if not validate:
+        return tuple(ordered)
 
+    parallel = backend is None
+    if backend is None:
+        backend = _default_backend()
+    probe = backend
+    with _backend_map(parallel) as mapper:
+        exists = list(mapper(lambda item: _key_exists(probe, item), ordered))
+    return tuple(item for item, present in zip(ordered, exists) if present)
 
-def search_registry(
+
+# Below this many keywords repeated ``in`` checks beat building an automaton.
+_AHOCORASICK_MIN_KEYWORDS = 4
+
+
+def _keyword_matcher(keywords: Tuple[str, ...]) -> Callable[[str], bool]:
+    """Return a predicate requiring every keyword to occur in its argument.
+
+    With ``pyahocorasick`` installed and enough keywords, all of them are
+    found in one pass over the text instead of one substring scan each.
+    """
+
+    required = tuple(dict.fromkeys(k for k in keywords if k))
+    if ahocorasick is None or len(required) < _AHOCORASICK_MIN_KEYWORDS:
+        return lambda text: all(k in text for k in required)
+    return _automaton_matcher(required)  # pragma: no cover - optional dependency
+
+
+def _automaton_matcher(required: Tuple[str, ...]) -> Callable[[str], bool]:  # pragma: no cover - optional dependency
+    automaton = ahocorasick.Automaton()
+    for index, keyword in enumerate(required):
+        automaton.add_word(keyword, index)
+    automaton.make_automaton()
+    complete = (1 << len(required)) - 1
+
+    def _matches(text: str) -> bool:
+        seen = 0
+        for _end, index in automaton.iter(text):
+            seen |= 1 << index
+            if seen == complete:
+                return True
+        return False
+
+    return _matches
+
+
+def _pattern_matcher(patterns: Tuple[re.Pattern[str], ...]) -> Optional[Callable[[str], bool]]:
+    """Return a predicate true when any of ``patterns`` matches its argument.
+
+    Patterns sharing the same flags and free of capture groups are folded into
+    one alternation so each value enters the regex engine once. Anything else
+    (mixed flags, groups that could clash or shift backreferences) keeps the
+    per-pattern scan.
+    """
+
+    if not patterns:
+        return None
+    if len(patterns) > 1 and len({p.flags for p in patterns}) == 1 and not any(p.groups for p in patterns):
+        try:
+            combined = re.compile(
+                "|".join(f"(?:{p.pattern})" for p in patterns),
+                patterns[0].flags,
+            )
+        except re.error:
+            pass
+        else:
+            return lambda text: combined.search(text) is not None
+    return lambda text: any(p.search(text) for p in patterns)
+
+
+# With ``SearchSpec.prune`` keys this shallow are always scanned; deeper keys
+# only when their path mentions one of the keywords.
+_PRUNE_SCAN_DEPTH = 2
+# Keywords shorter than this are too common in key names to steer pruning.
+_PRUNE_MIN_KEYWORD = 3
+
+
+@lru_cache(maxsize=2048)
+def _lower_name(name: str) -> str:
+    # Value names repeat heavily across keys ("DisplayName", "Publisher", ...),
+    # so reuse one lowered, interned copy per distinct name.
+    return sys.intern(name.lower())
+
+
+def _join_items(val: Sequence[object]) -> Optional[str]:
+    try:
+        return ", ".join(str(x) for x in val)
+    except Exception:
+        return None
+
+
+_VALUE_DECODERS: Dict[type, Callable[[object], Optional[str]]] = {
+    str: lambda v: v,  # type: ignore[dict-item]
+    bytes: lambda v: v.decode("utf-8", errors="replace"),  # type: ignore[attr-defined]
+    int: str,
+    float: str,
+    list: _join_items,  # type: ignore[dict-item]
+    tuple: _join_items,  # type: ignore[dict-item]
+}
+
+
+def _value_text(val: object) -> Optional[str]:
+    # Exact-type dispatch covers what backends return (REG_SZ strings above
+    # all); subclasses such as bool take the slow path.
+    decoder = _VALUE_DECODERS.get(type(val))
+    if decoder is not None:
+        return decoder(val)
+    if isinstance(val, (str, bytes)):
+        return val.decode("utf-8", errors="replace") if isinstance(val, bytes) else val
+    if isinstance(val, (int, float)):
+        return str(val)
+    if isinstance(val, (list, tuple)):
+        return _join_items(val)
+    return None
+
+
+def _value_matcher(
+    has_keywords: Optional[Callable[[str], bool]],
+    matches_pattern: Optional[Callable[[str], bool]],
+) -> Callable[[str, object], Optional[str]]:
+    """Return a ``(name, data) -> preview`` matcher specialised for the spec.
+
+    Picking the closure once per search keeps the "are there keywords /
+    patterns" branches out of the per-value path.
+    """
+
+    if has_keywords is not None and matches_pattern is None:
+
+        def _match_keywords(name: str, val: object) -> Optional[str]:
+            text = _value_text(val)
+            if text is None or not has_keywords(f"{_lower_name(name)} {text.lower()}"):
+                return None
+            return text[:120]
+
+        return _match_keywords
+
+    if has_keywords is None and matches_pattern is not None:
+
+        def _match_patterns(name: str, val: object) -> Optional[str]:
+            text = _value_text(val)
+            if text is None or not (matches_pattern(text) or matches_pattern(name)):
+                return None
+            return text[:120]
+
+        return _match_patterns
+
+    if has_keywords is None:
+
+        def _match_any(name: str, val: object) -> Optional[str]:
+            text = _value_text(val)
+            return None if text is None else text[:120]
+
+        return _match_any
+
+    def _match_both(name: str, val: object) -> Optional[str]:
+        text = _value_text(val)
+        if text is None or not has_keywords(f"{_lower_name(name)} {text.lower()}"):
+            return None
+        if not (matches_pattern(text) or matches_pattern(name)):
+            return None
+        return text[:120]
+
+    return _match_both
+
+
+def _visited_filter():
+    if ScalableBloomFilter is None:
+        return None
+    return ScalableBloomFilter(initial_capacity=10_000, error_rate=0.001)  # pragma: no cover - optional dependency
+
+
+def iter_search_registry(
     roots: Sequence[Tuple[str, str, Optional[str]]],
     spec: SearchSpec,
     *,
     backend: Optional[_Backend] = None,
-) -> Tuple[RegistryHit, ...]:
-    """Search registry trees under ``roots`` for values matching the spec.
-
-    Traversal is breadth-first, respects ``max_depth``, stops at ``max_hits``,
-    and halts when the time budget elapses. Nonexistent or inaccessible keys
-    are skipped silently.
+) -> Iterator[RegistryHit]:
+    """Yield registry values under ``roots`` that match the spec, as found.
+
+    Traversal is depth-first by default (``spec.strategy="bfs"`` restores
+    breadth-first order), respects ``max_depth``, stops at ``max_hits``, and
+    halts when the time budget elapses. Nonexistent or inaccessible keys are
+    skipped silently. With ``spec.prune`` set, keys more than
+    ``_PRUNE_SCAN_DEPTH`` levels below a root only have their values read
+    when the key path contains a keyword; their subkeys are still traversed.
+
+    A key reached again from a shallower position (overlapping roots under
+    DFS) is expanded again with the larger depth budget, but its values are
+    never reported twice. ``spec.approximate_visited`` swaps the exact
+    visited map for a Bloom filter when ``pybloom_live`` is installed; that
+    bounds memory but visits each key at most once, at whatever depth DFS
+    reaches it first, and may rarely skip a key.
     """
 
+    if spec.strategy not in ("dfs", "bfs"):
+        raise ValueError(f"Unknown search strategy: {spec.strategy!r}")
     if backend is None:
         backend = _default_backend()
 
     keywords = tuple(k.lower() for k in spec.keywords)
-    patterns = spec.patterns
+    has_keywords = _keyword_matcher(keywords)
+    path_hints = tuple(k for k in keywords if len(k) >= _PRUNE_MIN_KEYWORD) if spec.prune else ()
+    matches_pattern = _pattern_matcher(spec.patterns)
     max_depth = max(0, int(spec.max_depth))
     max_hits = max(1, int(spec.max_hits))
     deadline = time.monotonic() + max(0.1, float(spec.time_budget_s))
 
-    hits: List[RegistryHit] = []
-
-    def _match_value(name: str, val: object) -> Optional[str]:
-        text = None
-        if isinstance(val, (str, bytes)):
-            text = val.decode("utf-8", errors="replace") if isinstance(val, bytes) else val
-        elif isinstance(val, (int, float)):
-            text = str(val)
-        elif isinstance(val, (list, tuple)):
-            try:
-                text = ", ".join(str(x) for x in val)
-            except Exception:
-                text = None
-        if text is None:
-            return None
-        lower = text.lower()
-        name_lower = name.lower()
-        combined = f"{name_lower} {lower}"
-        if keywords and not all(k in combined for k in keywords):
-            return None
-        if patterns and not (any(p.search(text) for p in patterns) or any(p.search(name) for p in patterns)):
-            return None
-        return text[:120]
+    produced = 0
+
+    _match_value = _value_matcher(has_keywords if keywords else None, matches_pattern)
 
-    queue: List[Tuple[str, str, Optional[str], int]] = [(h, p, v, 0) for h, p, v in roots]
-    seen: set[Tuple[str, str, Optional[str]]] = set()
+    depth_first = spec.strategy == "dfs"
+    frontier: Deque[Tuple[str, str, Optional[str], int]] = deque((sys.intern(h), p, v, 0) for h, p, v in roots)
+    if depth_first:
+        frontier.reverse()
+    take = frontier.pop if depth_first else frontier.popleft
+    # DFS can reach a key deep under one root before a shallower root gets to
+    # it, so record the shallowest depth each key was expanded at rather than
+    # a plain visited set.
+    visited = _visited_filter() if spec.approximate_visited else None
+    expanded: Dict[_KeyId, int] = {}
 
-    while queue and len(hits) < max_hits and time.monotonic() < deadline:
-        hive, path, view, depth = queue.pop(0)
+    def _reads_values(path: str, depth: int) -> bool:
+        return not path_hints or depth <= _PRUNE_SCAN_DEPTH or any(k in path.lower() for k in path_hints)
+
+    while frontier and produced < max_hits and time.monotonic() < deadline:
+        hive, path, view, depth = take()
         key_id = (hive, path, view)
-        if key_id in seen:
-            continue
-        seen.add(key_id)
+        previous: Optional[int] = None
+        if visited is not None:  # pragma: no cover - optional dependency
+            if key_id in visited:
+                continue
+            visited.add(key_id)
+        else:
+            previous = expanded.get(key_id)
+            if previous is not None and previous <= depth:
+                continue
+            expanded[key_id] = depth
 
-        # Scan values at this key
-        for name, data in backend.enum_values(hive, path, view):
+        # Scan values at this key, unless an earlier visit already did.
+        values: Iterable[Tuple[str, object]] = ()
+        if _reads_values(path, depth) and (previous is None or not _reads_values(path, previous)):
+            values = backend.enum_values(hive, path, view)
+        for name, data in values:
             preview = _match_value(name, data)
             if preview is None:
                 continue
             reason = "keyword/pattern match"
-            hits.append(RegistryHit(path=path, hive=hive, value_name=name, data_preview=preview, reason=reason))
-            if len(hits) >= max_hits:
+            yield RegistryHit(path=path, hive=hive, value_name=name, data_preview=preview, reason=reason)
+            produced += 1
+            if produced >= max_hits:
                 break
-        if len(hits) >= max_hits:
+        if produced >= max_hits:
             break
 
         # Enqueue subkeys if depth allows
         if depth >= max_depth:
             continue
 
-        for child in backend.enum_subkeys(hive, path, view):
-            child_path = f"{path}\\{child}"
-            queue.append((hive, child_path, view, depth + 1))
+        children = backend.enum_subkeys(hive, path, view)
+        if depth_first:
+            # Push in reverse so siblings are still visited in listing order.
+            children = reversed(children)
+        prefix = path + "\\"
+        child_depth = depth + 1
+        frontier.extend((hive, prefix + child, view, child_depth) for child in children)
+
+
+def search_registry(
+    roots: Sequence[Tuple[str, str, Optional[str]]],
+    spec: SearchSpec,
+    *,
+    backend: Optional[_Backend] = None,
+) -> Tuple[RegistryHit, ...]:
+    """Search registry trees under ``roots`` for values matching the spec.
+
+    Collects :func:`iter_search_registry` into a tuple; see it for traversal
+    details.
+    """
 
-    return tuple(hits)
+    return tuple(iter_search_registry(roots, spec, backend=backend))
@@ -8,8 +8,8 @@ from typing import Any, Sequence
 from .registry import (
     enumerate_installed_apps,
     find_app_registry_roots,
+    iter_search_registry,
     parse_registry_root_descriptor,
-    search_registry,
     SearchSpec,
     is_windows,
 )
@@ -157,8 +157,8 @@ def main(argv: Sequence[str] | None = None) -> int:
             max_hits=args.max_hits,
             time_budget_s=args.time_budget,
         )
-        hits = search_registry(roots, spec)
-        for hit in hits:
+        # Print hits as the walk finds them rather than after it completes.
+        for hit in iter_search_registry(roots, spec):
             print(f"{hit.hive} \\ {hit.path} :: {hit.value_name} = {hit.data_preview}")
         return 0
 
@@ -3,25 +3,29 @@
 from __future__ import annotations
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from difflib import SequenceMatcher, unified_diff
+from difflib import SequenceMatcher
+from functools import lru_cache
 from datetime import datetime, timezone
 from hashlib import sha256
 import re
 import xml.etree.ElementTree as ET
-from typing import Callable, Iterable, Mapping, MutableMapping, Sequence
+from typing import Any, Callable, Iterable, Mapping, MutableMapping, Sequence
 
 from .redaction import RedactionFilter, resolve_redactor
 
+try:  # pragma: no cover - optional C matcher
+    from cdifflib import CSequenceMatcher as _SequenceMatcher  # type: ignore
+except ImportError:  # pragma: no cover - optional C matcher
+    _SequenceMatcher = SequenceMatcher
+
 
 def _apply_redaction(lines: Iterable[str], redactor: RedactionFilter | None) -> list[str]:
     if not redactor:
         return list(lines)
-    return [redactor.apply(line) for line in lines]
-
-
-def _digest(value: str) -> str:
-    return f"sha256:{sha256(value.encode('utf-8')).hexdigest()}"
+    return redactor.apply_batch(list(lines))
 
 
 def _digest_bytes(payload: bytes) -> str:
@@ -30,29 +34,67 @@ def _digest_bytes(payload: bytes) -> str:
 
 _BOM = "\ufeff"
 _UNICODE_NEWLINES = ("\u2028", "\u2029", "\u0085")
-
+_LINE_BREAKS = frozenset("\n\r").union(_UNICODE_NEWLINES)
+# Inputs where ``str.splitlines`` disagrees with the replace-based newline
+# normalisation: separators it breaks on that canonical text keeps inside a
+# line, and CR followed by a Unicode newline (which collapses like CRLF).
+# Plain substring checks are used because they run at memchr speed, well
+# ahead of a regex scan over the same payload.
+_SPLITLINES_MISMATCH = ("\v", "\f", "\x1c", "\x1d", "\x1e", "\r\x85", "\r\u2028", "\r\u2029")
+
+_CANONICAL_CACHE_SIZE = 32  # Recently canonicalised payloads kept per process.
+# Payloads longer than this bypass the canonical and payload-hash caches so a
+# burst of large files cannot pin ~32 copies of each in memory; each cache
+# therefore keys on at most _CANONICAL_CACHE_SIZE * 64K-char payloads.
+_CANONICAL_CACHE_MAX_CHARS = 64 * 1024
 _SAFE_DIFF_MAX_CANONICAL_BYTES = 256 * 1024  # 256 KiB clamp per canonical payload.
 _SAFE_DIFF_MAX_DIFF_BYTES = 128 * 1024  # 128 KiB clamp for unified diff output.
 _SAFE_DIFF_MAX_DIFF_LINES = 600  # Hard limit for rendered diff lines.
+_SUMMARY_PARALLEL_MIN_RESULTS = 16  # Batches below this size summarise inline.
+_SUMMARY_PARALLEL_MIN_TEXT_CHARS = 2 * 1024  # Mean canonical text size needed to use the pool.
 
 
 def canonicalise_text(payload: str) -> str:
     """Return ``payload`` with normalised newlines and trimmed trailing spaces."""
 
+    return _canonicalise_text_lines(payload)[0]
+
+
+def _canonicalise_text_lines(payload: str) -> tuple[str, list[str] | None]:
+    """Return canonical text plus its ``splitlines()`` form when known.
+
+    The fast path already holds the split lines, so diffing can reuse them
+    instead of splitting the joined text again. ``None`` means the caller
+    must split the canonical text itself.
+    """
+
     if not payload:
-        return ""
+        return "", []
 
     working = payload
     if working.startswith(_BOM):
         working = working.lstrip(_BOM)
 
+    if not any(marker in working for marker in _SPLITLINES_MISMATCH):
+        # ``splitlines`` breaks on exactly the separators handled below (CRLF,
+        # CR, LF and the Unicode newlines) in one pass, but drops the empty
+        # line after a trailing separator, so restore it.
+        lines = list(map(str.rstrip, working.splitlines()))
+        if working and working[-1] in _LINE_BREAKS:
+            return "\n".join(lines) + "\n", lines
+        canonical = "\n".join(lines)
+        if lines and not lines[-1]:
+            # A whitespace-only last line ends the text with "\n", which
+            # ``splitlines`` would not report as a line of its own.
+            lines.pop()
+        return canonical, lines
+
     for separator in _UNICODE_NEWLINES:
         if separator in working:
             working = working.replace(separator, "\n")
 
     normalised = working.replace("\r\n", "\n").replace("\r", "\n")
-    lines = [line.rstrip() for line in normalised.split("\n")]
-    return "\n".join(lines)
+    return "\n".join(map(str.rstrip, normalised.split("\n"))), None
 
 
 def canonicalise_json(payload: str) -> str:
@@ -81,6 +123,31 @@ def canonicalise_json(payload: str) -> str:
 
 
 _XML_DECLARATION_PATTERN = re.compile(r"<\?xml[^>]*\?>", re.IGNORECASE)
+_DOCTYPE_DELIMITER_PATTERN = re.compile(r"[\[\]>]")
+
+
+def _normalise_xml_element(element: ET.Element) -> None:
+    # Sort attributes but only collapse values that are pure whitespace so
+    # intentional padding survives canonicalisation. Most elements have no
+    # attributes or already list them in order, so only rebuild when needed.
+    attrib = element.attrib
+    if attrib:
+        keys = list(attrib)
+        if len(keys) > 1:
+            ordered = sorted(keys)
+            if ordered != keys:
+                attrib = element.attrib = {key: attrib[key] for key in ordered}
+        for key, value in attrib.items():
+            if value and not value.strip():
+                attrib[key] = ""
+    text = element.text
+    if text and not text.strip():
+        # Whitespace-only text nodes collapse, otherwise padding stays.
+        element.text = ""
+    tail = element.tail
+    if tail and not tail.strip():
+        # Only trim tails that are entirely whitespace.
+        element.tail = ""
 
 
 def canonicalise_xml(payload: str) -> str:
@@ -107,16 +174,20 @@ def canonicalise_xml(payload: str) -> str:
         xml_declaration = declaration_match.group(0)
         working = working[declaration_match.end() :].lstrip()
 
-    if working.upper().startswith("<!DOCTYPE"):
+    if working[:9].upper() == "<!DOCTYPE":
         end = 0
         depth = 0
-        for index, character in enumerate(working):
+        # Only brackets and ``>`` affect where the DOCTYPE ends, so let the
+        # regex engine skip everything in between.
+        for match in _DOCTYPE_DELIMITER_PATTERN.finditer(working):
+            character = match.group()
             if character == "[":
                 depth += 1
-            elif character == "]" and depth:
-                depth -= 1
-            elif character == ">" and depth == 0 and index:
-                end = index + 1
+            elif character == "]":
+                if depth:
+                    depth -= 1
+            elif depth == 0:
+                end = match.end()
                 break
         if end:
             doctype = working[:end]
@@ -128,33 +199,20 @@ def canonicalise_xml(payload: str) -> str:
             doctype = ""
 
     try:
-        parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True))
-        root = ET.fromstring(working, parser=parser)
+        if "<!--" in working:
+            parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True))
+            root = ET.fromstring(working, parser=parser)
+        else:
+            # Without comments to keep, the default parser builds the same
+            # tree without constructing a dedicated TreeBuilder target.
+            root = ET.fromstring(working)
     except ET.ParseError:
         return canonicalise_text(payload)
 
-    def _normalise(element: ET.Element) -> None:
-        # Sort attributes but only collapse values that are pure whitespace so
-        # intentional padding survives canonicalisation.
-        attribute_items = sorted(element.attrib.items())
-        element.attrib.clear()
-        for key, value in attribute_items:
-            stripped = value.strip()
-            element.attrib[key] = value if stripped else stripped
-        if element.text is not None:
-            stripped = element.text.strip()
-            if not stripped:
-                # Whitespace-only text nodes collapse, otherwise padding stays.
-                element.text = stripped
-        for child in list(element):
-            _normalise(child)
-            if child.tail is not None:
-                stripped = child.tail.strip()
-                if not stripped:
-                    # Only trim tails that are entirely whitespace.
-                    child.tail = stripped
-
-    _normalise(root)
+    # ``iter`` walks the tree in C, avoiding a Python frame per element and
+    # recursion limits on deeply nested documents.
+    for element in root.iter():
+        _normalise_xml_element(element)
     serialised = ET.tostring(root, encoding="unicode")
     prolog_parts = [part for part in (xml_declaration, doctype) if part]
     if prolog_parts:
@@ -170,6 +228,33 @@ _NORMALISERS: Mapping[str, Callable[[str], str]] = {
 }
 
 
+def _canonicalise_payload(content_type: str, payload: str) -> tuple[str, tuple[str, ...]]:
+    if content_type == "text":
+        canonical, lines = _canonicalise_text_lines(payload)
+        if lines is not None:
+            return canonical, tuple(lines)
+        return canonical, tuple(canonical.splitlines())
+    canonical = _NORMALISERS[content_type](payload)
+    return canonical, tuple(canonical.splitlines())
+
+
+_canonicalise_cached = lru_cache(maxsize=_CANONICAL_CACHE_SIZE)(_canonicalise_payload)
+
+
+def _canonicalise(content_type: str, payload: str) -> tuple[str, tuple[str, ...]]:
+    """Return the canonical payload and the lines it contributes to a diff.
+
+    Results are cached because drift checks usually diff one baseline against
+    many candidates; lines are returned as a tuple so cached entries cannot
+    be mutated by callers. Payloads over ``_CANONICAL_CACHE_MAX_CHARS`` are
+    canonicalised afresh each time to keep the cache's footprint bounded.
+    """
+
+    if len(payload) > _CANONICAL_CACHE_MAX_CHARS:
+        return _canonicalise_payload(content_type, payload)
+    return _canonicalise_cached(content_type, payload)
+
+
 def _append_notice(text: str, notice: str) -> str:
     stripped = text.rstrip("\n")
     if stripped:
@@ -188,7 +273,7 @@ def _truncate_canonical_payload(
     if size_bytes <= _SAFE_DIFF_MAX_CANONICAL_BYTES:
         return payload, None
 
-    digest = _digest(payload)
+    digest = _digest_bytes(encoded)
     truncated_bytes = size_bytes - _SAFE_DIFF_MAX_CANONICAL_BYTES
     safe_bytes = encoded[:_SAFE_DIFF_MAX_CANONICAL_BYTES]
     safe_payload = safe_bytes.decode("utf-8", "ignore")
@@ -219,8 +304,11 @@ def _truncate_diff_output(
 
     lines = diff_text.splitlines()
     total_lines = len(lines)
-    total_bytes = len(diff_text.encode("utf-8"))
-    digest = _digest(diff_text)
+    encoded = diff_text.encode("utf-8")
+    total_bytes = len(encoded)
+    if total_lines <= _SAFE_DIFF_MAX_DIFF_LINES and total_bytes <= _SAFE_DIFF_MAX_DIFF_BYTES:
+        # Diffs within both limits are returned as-is; skip rebuilding them.
+        return diff_text, None
 
     truncated_lines = 0
     truncated_bytes = 0
@@ -237,13 +325,14 @@ def _truncate_diff_output(
         working_text = working_bytes.decode("utf-8", "ignore")
 
     if truncated_lines == 0 and truncated_bytes == 0:
-        if total_bytes > _SAFE_DIFF_MAX_DIFF_BYTES:
-            truncated_bytes = total_bytes - _SAFE_DIFF_MAX_DIFF_BYTES
-            working_bytes = diff_text.encode("utf-8")[:_SAFE_DIFF_MAX_DIFF_BYTES]
-            working_text = working_bytes.decode("utf-8", "ignore")
-        else:
-            return diff_text, None
+        # Rejoining with "\n" shrank the text under the byte limit, but the
+        # original separators keep it over, so clamp the original bytes.
+        truncated_bytes = total_bytes - _SAFE_DIFF_MAX_DIFF_BYTES
+        working_bytes = encoded[:_SAFE_DIFF_MAX_DIFF_BYTES]
+        working_text = working_bytes.decode("utf-8", "ignore")
 
+    # Only clamped output reports a digest, so skip hashing diffs that fit.
+    digest = _digest_bytes(encoded)
     segments = []
     if truncated_lines:
         segments.append(f"{truncated_lines} lines")
@@ -293,7 +382,7 @@ def _enforce_diff_safety_limits(
     return clamped_before, clamped_after, diff_clamped, limits
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BinarySegmentEvidence:
     label: str
     before_size: int
@@ -304,7 +393,7 @@ class BinarySegmentEvidence:
     reason: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiffResult:
     """Structured diff artefact for downstream adapters."""
 
@@ -322,9 +411,13 @@ class DiffResult:
     redaction_counts: Mapping[str, int] | None = None
     binary_evidence: Sequence[BinarySegmentEvidence] | None = None
     safety_limits: Mapping[str, object] | None = None
+    # Line counts of the canonical payloads, recorded by build_unified_diff
+    # when it already holds the split lines so summaries skip re-splitting.
+    _before_line_count: int | None = field(default=None, init=False, repr=False, compare=False)
+    _after_line_count: int | None = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiffChangeSummary:
     before_digest: str
     after_digest: str
@@ -336,7 +429,7 @@ class DiffChangeSummary:
     changed_lines: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiffPlanSummary:
     content_type: str
     from_label: str | None
@@ -350,7 +443,7 @@ class DiffPlanSummary:
     safety_limits: Mapping[str, object] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiffMetadataSummary:
     content_type: str
     context_lines: int
@@ -358,7 +451,7 @@ class DiffMetadataSummary:
     comparison_name: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiffComparisonSummary:
     from_label: str
     to_label: str
@@ -367,19 +460,25 @@ class DiffComparisonSummary:
     summary: DiffChangeSummary
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiffResultSummary:
     generated_at: datetime
     versions: tuple[str, ...]
     comparisons: tuple[DiffComparisonSummary, ...]
-    comparison_count: int = field(init=False)
 
-    def __post_init__(self) -> None:
-        object.__setattr__(self, "comparison_count", len(self.comparisons))
+    @property
+    def comparison_count(self) -> int:
+        return len(self.comparisons)
 
 
-def _calculate_stats(before: list[str], after: list[str]) -> Mapping[str, int]:
-    matcher = SequenceMatcher(None, before, after)
+def _calculate_stats(
+    before: Sequence[str],
+    after: Sequence[str],
+    *,
+    matcher: SequenceMatcher | None = None,
+) -> Mapping[str, int]:
+    if matcher is None:
+        matcher = _SequenceMatcher(None, before, after)
     added = removed = changed = 0
     for tag, i1, i2, j1, j2 in matcher.get_opcodes():
         if tag == "equal":
@@ -393,6 +492,56 @@ def _calculate_stats(before: list[str], after: list[str]) -> Mapping[str, int]:
     return {"added_lines": added, "removed_lines": removed, "changed_lines": changed}
 
 
+def _format_unified_range(start: int, stop: int) -> str:
+    # Same "ed"-style range as ``difflib.unified_diff`` hunk headers.
+    length = stop - start
+    if length == 1:
+        return f"{start + 1}"
+    if not length:
+        return f"{start},0"
+    return f"{start + 1},{length}"
+
+
+def _unified_diff_with_stats(
+    before: Sequence[str],
+    after: Sequence[str],
+    *,
+    from_label: str,
+    to_label: str,
+    context_lines: int,
+) -> tuple[str, Mapping[str, int]]:
+    """Return ``difflib.unified_diff`` text (``lineterm=""``) and line stats.
+
+    Both come from one :class:`SequenceMatcher`, whose opcodes are computed
+    once and cached, instead of matching the same lines a second time for
+    the statistics.
+    """
+
+    if before == after:
+        # SequenceMatcher does not short-circuit identical input.
+        return "", {"added_lines": 0, "removed_lines": 0, "changed_lines": 0}
+    matcher = _SequenceMatcher(None, before, after)
+    output: list[str] = []
+    for group in matcher.get_grouped_opcodes(context_lines):
+        if not output:
+            output.append(f"--- {from_label}")
+            output.append(f"+++ {to_label}")
+        first, last = group[0], group[-1]
+        output.append(
+            f"@@ -{_format_unified_range(first[1], last[2])} "
+            f"+{_format_unified_range(first[3], last[4])} @@"
+        )
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                output.extend(" " + line for line in before[i1:i2])
+                continue
+            if tag in ("replace", "delete"):
+                output.extend("-" + line for line in before[i1:i2])
+            if tag in ("replace", "insert"):
+                output.extend("+" + line for line in after[j1:j2])
+    return "\n".join(output), _calculate_stats(before, after, matcher=matcher)
+
+
 def build_unified_diff(
     before: str,
     after: str,
@@ -408,33 +557,33 @@ def build_unified_diff(
 ) -> DiffResult:
     """Return :class:`DiffResult` with canonicalised payloads and unified diff."""
 
-    try:
-        normaliser = _NORMALISERS[content_type]
-    except KeyError as exc:
-        raise ValueError(f"Unsupported content_type: {content_type}") from exc
+    if content_type not in _NORMALISERS:
+        raise ValueError(f"Unsupported content_type: {content_type}")
 
-    canonical_before = normaliser(before)
-    canonical_after = normaliser(after)
+    canonical_before, before_split = _canonicalise(content_type, before)
+    canonical_after, after_split = _canonicalise(content_type, after)
 
     active_redactor = resolve_redactor(redactor=redactor, mask_tokens=mask_tokens, placeholder=placeholder)
     result_placeholder = placeholder
     if active_redactor:
         result_placeholder = active_redactor.placeholder
-    before_lines = _apply_redaction(canonical_before.splitlines(), active_redactor)
-    after_lines = _apply_redaction(canonical_after.splitlines(), active_redactor)
+    before_lines = _apply_redaction(before_split, active_redactor)
+    if canonical_after == canonical_before and not active_redactor:
+        # Unchanged payloads (the common no-drift case) share one line list;
+        # with a redactor both sides still run so its counts stay complete.
+        after_lines = before_lines
+    else:
+        after_lines = _apply_redaction(after_split, active_redactor)
     redaction_counts: Mapping[str, int] | None = None
     if active_redactor:
         redaction_counts = active_redactor.stats()
-    diff_iter = unified_diff(
+    diff_text, stats = _unified_diff_with_stats(
         before_lines,
         after_lines,
-        fromfile=from_label,
-        tofile=to_label,
-        lineterm="",
-        n=context_lines,
+        from_label=from_label,
+        to_label=to_label,
+        context_lines=context_lines,
     )
-    diff_text = "\n".join(diff_iter)
-    stats = _calculate_stats(before_lines, after_lines)
     mask_tuple: Sequence[str] | None = None
     if active_redactor:
         ordered = getattr(active_redactor, "_ordered_tokens", ())
@@ -447,7 +596,7 @@ def build_unified_diff(
         canonical_before, canonical_after, diff_text
     )
 
-    return DiffResult(
+    result = DiffResult(
         canonical_before=safe_before,
         canonical_after=safe_after,
         diff=safe_diff,
@@ -463,6 +612,11 @@ def build_unified_diff(
         binary_evidence=None,
         safety_limits=safety_limits,
     )
+    if safe_before is canonical_before:
+        object.__setattr__(result, "_before_line_count", len(before_split))
+    if safe_after is canonical_after:
+        object.__setattr__(result, "_after_line_count", len(after_split))
+    return result
 
 
 def build_binary_diff(
@@ -476,15 +630,17 @@ def build_binary_diff(
 ) -> DiffResult:
     """Return :class:`DiffResult` summarising binary payload changes."""
 
+    changed = before != after
     before_digest = _digest_bytes(before)
-    after_digest = _digest_bytes(after)
+    # Identical payloads share a digest, so skip hashing the second copy.
+    after_digest = _digest_bytes(after) if changed else before_digest
     evidence = BinarySegmentEvidence(
         label=label or "binary",
         before_size=len(before),
         after_size=len(after),
         before_digest=before_digest,
         after_digest=after_digest,
-        changed=before != after,
+        changed=changed,
         reason=reason,
     )
     delta = len(after) - len(before)
@@ -519,6 +675,27 @@ def build_binary_diff(
     )
 
 
+def _hash_payload(payload: str) -> Any:
+    return sha256(payload.encode("utf-8"))
+
+
+_payload_hash_cached = lru_cache(maxsize=_CANONICAL_CACHE_SIZE)(_hash_payload)
+
+
+def _payload_hash(payload: str) -> Any:
+    """Return a ``sha256`` object fed with ``payload``, cached when small.
+
+    Summaries of many comparisons against one baseline hash it once. The
+    object may be shared, so callers must ``copy()`` it before ``update()``.
+    Payloads over ``_CANONICAL_CACHE_MAX_CHARS`` are hashed afresh so the
+    cache keys never pin large payloads in memory.
+    """
+
+    if len(payload) > _CANONICAL_CACHE_MAX_CHARS:
+        return _hash_payload(payload)
+    return _payload_hash_cached(payload)
+
+
 def _build_comparison_summary(
     result: DiffResult,
     baseline_name: str | None,
@@ -526,16 +703,28 @@ def _build_comparison_summary(
 ) -> DiffComparisonSummary:
     """Return a :class:`DiffComparisonSummary` for ``result``."""
 
-    before_lines = result.canonical_before.splitlines()
-    after_lines = result.canonical_after.splitlines()
+    before_line_count = result._before_line_count
+    if before_line_count is None:
+        before_line_count = len(result.canonical_before.splitlines())
+    after_line_count = result._after_line_count
+    if after_line_count is None:
+        after_line_count = len(result.canonical_after.splitlines())
     stats = result.stats or {}
 
+    # The combined digest continues from the cached before-hash instead of
+    # hashing a joined copy of both payloads.
+    before_hash = _payload_hash(result.canonical_before)
+    after_hash = _payload_hash(result.canonical_after)
+    combined = before_hash.copy()
+    combined.update(b"\n---\n")
+    combined.update(result.canonical_after.encode("utf-8"))
+
     change_summary = DiffChangeSummary(
-        before_digest=_digest(result.canonical_before),
-        after_digest=_digest(result.canonical_after),
-        diff_digest=_digest(f"{result.canonical_before}\n---\n{result.canonical_after}"),
-        before_lines=len(before_lines),
-        after_lines=len(after_lines),
+        before_digest=f"sha256:{before_hash.hexdigest()}",
+        after_digest=f"sha256:{after_hash.hexdigest()}",
+        diff_digest=f"sha256:{combined.hexdigest()}",
+        before_lines=before_line_count,
+        after_lines=after_line_count,
         added_lines=int(stats.get("added_lines", 0)),
         removed_lines=int(stats.get("removed_lines", 0)),
         changed_lines=int(stats.get("changed_lines", 0)),
@@ -576,25 +765,35 @@ def summarise_diff_result(
     versions: Sequence[str] | None = None,
     baseline_name: str | None = None,
     comparison_name: str | None = None,
+    generated_at: datetime | None = None,
 ) -> DiffResultSummary:
-    """Return :class:`DiffResultSummary` describing ``result``."""
+    """Return :class:`DiffResultSummary` describing ``result``.
+
+    ``generated_at`` defaults to the current UTC time; callers summarising
+    many results in one pass can supply a shared timestamp instead.
+    """
 
     comparison_summary = _build_comparison_summary(result, baseline_name, comparison_name)
 
     versions_tuple = tuple(versions or ())
     return DiffResultSummary(
-        generated_at=datetime.now(timezone.utc),
+        generated_at=generated_at or datetime.now(timezone.utc),
         versions=versions_tuple,
         comparisons=(comparison_summary,),
     )
 
 
+def _canonical_chars(results: Sequence[DiffResult]) -> int:
+    return sum(len(result.canonical_before) + len(result.canonical_after) for result in results)
+
+
 def summarise_diff_results(
     results: Sequence[DiffResult],
     *,
     versions: Sequence[str] | None = None,
     baseline_names: Sequence[str | None] | None = None,
     comparison_names: Sequence[str | None] | None = None,
+    generated_at: datetime | None = None,
 ) -> DiffResultSummary:
     """Return a combined :class:`DiffResultSummary` for ``results``.
 
@@ -602,7 +801,8 @@ def summarise_diff_results(
     can provide explicit ``baseline_names`` or ``comparison_names`` for the
     generated metadata payload. When a name sequence is supplied its length
     must match ``results``; otherwise the originating ``from_label``/
-    ``to_label`` values are reused.
+    ``to_label`` values are reused. ``generated_at`` defaults to the current
+    UTC time.
     """
 
     if not results:
@@ -613,16 +813,28 @@ def summarise_diff_results(
     if comparison_names is not None and len(comparison_names) != len(results):
         raise ValueError("comparison_names length must match results")
 
-    comparisons: list[DiffComparisonSummary] = []
-    for index, result in enumerate(results):
-        baseline_name = baseline_names[index] if baseline_names is not None else None
-        comparison_name = comparison_names[index] if comparison_names is not None else None
-        comparisons.append(_build_comparison_summary(result, baseline_name, comparison_name))
+    count = len(results)
+    baselines = baseline_names if baseline_names is not None else (None,) * count
+    names = comparison_names if comparison_names is not None else (None,) * count
+
+    workers = min(count, os.cpu_count() or 1)
+    if (
+        count >= _SUMMARY_PARALLEL_MIN_RESULTS
+        and workers > 1
+        and _canonical_chars(results) >= 2 * count * _SUMMARY_PARALLEL_MIN_TEXT_CHARS
+    ):
+        # hashlib releases the GIL while digesting large payloads, so big
+        # batches overlap their hashing; ``map`` keeps the result order.
+        # Small payloads hash faster than the pool starts, so they stay inline.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            comparisons = tuple(executor.map(_build_comparison_summary, results, baselines, names))
+    else:
+        comparisons = tuple(map(_build_comparison_summary, results, baselines, names))
 
     return DiffResultSummary(
-        generated_at=datetime.now(timezone.utc),
+        generated_at=generated_at or datetime.now(timezone.utc),
         versions=tuple(versions or ()),
-        comparisons=tuple(comparisons),
+        comparisons=comparisons,
     )
 
 
@@ -34,6 +34,28 @@ class RedactionFilter:
             result = result.replace(token, self.placeholder)
         return result
 
+    def apply_batch(self, lines: Sequence[str]) -> list[str]:
+        """Return ``lines`` redacted exactly as :meth:`apply` would per line.
+
+        The lines are joined so each token is counted and replaced once across
+        the whole batch. Line-by-line application is used whenever joining
+        could change the result: a subclass overrides :meth:`apply`, or a
+        newline appears in a token, the placeholder, or one of the lines.
+        """
+
+        if not lines:
+            return []
+        if (
+            type(self).apply is not RedactionFilter.apply
+            or "\n" in self.placeholder
+            or any("\n" in token for token in self._ordered_tokens)
+        ):
+            return [self.apply(line) for line in lines]
+        joined = "\n".join(lines)
+        if joined.count("\n") != len(lines) - 1:
+            return [self.apply(line) for line in lines]
+        return self.apply(joined).split("\n")
+
     def stats(self) -> Mapping[str, int]:
         """Return a read-only view of the redaction counts."""
 
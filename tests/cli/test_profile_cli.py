@@ -96,13 +96,10 @@ def test_profile_cli_hunt_bridge(tmp_path: Path, capsys: pytest.CaptureFixture[s
 
 
 def test_store_from_payload_ignores_invalid_entries(monkeypatch: pytest.MonkeyPatch) -> None:
-    original_from_dict = getattr(profile_cli.ProfileStore, "from_dict", None)
+    def boom(_payload):
+        raise ValueError("fallback")
 
-    if original_from_dict is not None:
-        def boom(_payload):
-            raise ValueError("fallback")
-
-        monkeypatch.setattr(profile_cli.ProfileStore, "from_dict", boom)
+    monkeypatch.setattr(profile_cli, "_PROFILE_STORE_FROM_DICT", boom)
 
     payload = {
         "profiles": [
@@ -117,9 +114,6 @@ def test_store_from_payload_ignores_invalid_entries(monkeypatch: pytest.MonkeyPa
     summary = store.summary()
     assert summary["total_profiles"] == 1
 
-    if original_from_dict is not None:
-        monkeypatch.setattr(profile_cli.ProfileStore, "from_dict", original_from_dict)
-
 
 def test_handle_hunt_bridge_validates_payload(tmp_path: Path) -> None:
     store_path = tmp_path / "store.json"
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 import argparse
+import io
 import json
+import sys
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
+from driftbuster import profile_cli
 from driftbuster.core.profiles import ConfigurationProfile, ProfileConfig, ProfileStore
 from driftbuster.profile_cli import (
     _build_bridge_payload,
     _handle_diff,
     _handle_hunt_bridge,
     _handle_summary,
+    _load_json,
+    _normalise_payload,
     _store_from_payload,
     _write_json,
     parse_args,
@@ -34,10 +40,10 @@ def test_store_from_payload_fallback(monkeypatch) -> None:
         ]
     }
 
-    def broken(cls, *_args, **_kwargs):
+    def broken(*_args, **_kwargs):
         raise RuntimeError("broken path")
 
-    monkeypatch.setattr(ProfileStore, "from_dict", classmethod(broken))
+    monkeypatch.setattr(profile_cli, "_PROFILE_STORE_FROM_DICT", broken)
     store = _store_from_payload(payload)
     configs = store.find_config("cfg1")
     assert configs
@@ -148,3 +154,250 @@ def test_parse_args_requires_command() -> None:
 
     with pytest.raises(SystemExit):
         parse_args([])
+
+
+def test_normalise_payload_handles_frozen_and_deep_payloads() -> None:
+    payload = MappingProxyType(
+        {"tags": frozenset({"prod"}), "items": ({"value": (1, 2)}, [3])}
+    )
+    assert _normalise_payload(payload) == {
+        "tags": ["prod"],
+        "items": [{"value": [1, 2]}, [3]],
+    }
+
+    deep: object = "leaf"
+    for _ in range(sys.getrecursionlimit() + 50):
+        deep = {"child": (deep,)}
+    normalised = _normalise_payload(deep)
+    depth = 0
+    while isinstance(normalised, dict):
+        (normalised,) = normalised["child"]
+        depth += 1
+    assert normalised == "leaf"
+    assert depth == sys.getrecursionlimit() + 50
+
+
+def test_build_bridge_payload_reuses_matches_per_relative_path(monkeypatch) -> None:
+    store = ProfileStore(
+        [
+            ConfigurationProfile(
+                name="demo",
+                tags={"zeta", "alpha"},
+                configs=(ProfileConfig(identifier="cfg1", path="logs/app.log"),),
+            )
+        ]
+    )
+    calls: list[object] = []
+    original = store.prepare_index
+
+    def tracking_index(tags):
+        index = original(tags)
+        match = index.match
+
+        def tracking(relative_path):
+            calls.append(relative_path)
+            return match(relative_path)
+
+        index.match = tracking
+        return index
+
+    monkeypatch.setattr(store, "prepare_index", tracking_index)
+    hunts = [
+        {"relative_path": "logs/app.log", "rule": {"name": "a"}},
+        {"relative_path": "logs/app.log", "rule": {"name": "b"}},
+        {"relative_path": "other.txt", "rule": {"name": "c"}},
+    ]
+    payload = _build_bridge_payload(store, hunts, tags=["alpha", "zeta"], root=None)
+
+    assert calls == ["logs/app.log", "other.txt"]
+    assert [len(item["profiles"]) for item in payload["items"]] == [1, 1, 0]
+    first, second = (item["profiles"][0]["profile_tags"] for item in payload["items"][:2])
+    assert first == second == ["alpha", "zeta"]
+    assert first is not second
+
+
+def test_write_json_keeps_previous_output_when_encoding_fails(tmp_path: Path) -> None:
+    output = tmp_path / "out.json"
+    output.write_text('{"previous": true}\n', encoding="utf-8")
+
+    with pytest.raises(TypeError):
+        _write_json({"ok": 1, "bad": object()}, output=output, indent=2, sort_keys=False)
+
+    assert output.read_text(encoding="utf-8") == '{"previous": true}\n'
+    assert [path.name for path in tmp_path.iterdir()] == ["out.json"]
+
+
+def test_write_json_round_trips_unicode_and_large_numbers(tmp_path: Path) -> None:
+    payload = {"name": "café", "big": 2**70, "nested": {"b": 1, "a": [1.5]}}
+    output = tmp_path / "out.json"
+    _write_json(payload, output=output, indent=2, sort_keys=True)
+    text = output.read_text(encoding="utf-8")
+    assert json.loads(text) == payload
+    assert text.endswith("}\n")
+    assert text.index('"big"') < text.index('"name"')
+
+
+def test_load_json_accepts_non_finite_numbers(tmp_path: Path) -> None:
+    path = tmp_path / "payload.json"
+    path.write_text('{"value": NaN, "name": "caf\\u00e9"}', encoding="utf-8")
+    payload = _load_json(path)
+    assert payload["name"] == "café"
+    assert payload["value"] != payload["value"]
+
+
+def test_build_bridge_payload_resolves_paths_against_root() -> None:
+    store = ProfileStore([ConfigurationProfile(name="demo", configs=())])
+    payload = _build_bridge_payload(
+        store,
+        [
+            {"path": "/deploy/web/conf/app.json"},
+            {"path": "/deploy/webapp/app.json"},
+            {"path": "C:\\deploy\\web\\logs\\app.log"},
+        ],
+        tags=None,
+        root=Path("/deploy/web"),
+    )
+    relatives = [item["relative_path"] for item in payload["items"]]
+    assert relatives == ["conf/app.json", "app.json", "app.log"]
+
+
+def test_write_json_streams_to_text_only_stdout(monkeypatch) -> None:
+    buffer = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", buffer)
+    payload = {"items": [{"name": "café"}], "count": 2**70}
+
+    _write_json(payload, output=None, indent=2, sort_keys=False)
+    _write_json(payload, output=None, indent=4, sort_keys=True)
+
+    first, second = buffer.getvalue().split("\n}\n", 1)
+    assert json.loads(first + "\n}") == payload
+    assert json.loads(second) == payload
+    assert second.endswith("}\n")
+
+
+@pytest.mark.parametrize("indent", [0, 2])
+def test_write_json_converts_frozen_containers(tmp_path: Path, indent: int) -> None:
+    payload = MappingProxyType(
+        {"tags": frozenset({"prod"}), "nested": (MappingProxyType({"ok": True}),)}
+    )
+    output = tmp_path / "out.json"
+    _write_json(payload, output=output, indent=indent, sort_keys=True)
+    assert json.loads(output.read_text(encoding="utf-8")) == {
+        "tags": ["prod"],
+        "nested": [{"ok": True}],
+    }
+
+    with pytest.raises(TypeError):
+        _write_json({"bad": object()}, output=output, indent=indent, sort_keys=False)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"value": float("nan"), "limit": float("inf"), "floor": float("-inf")},
+        {"name": "café", "nested": ["\x7f", {"ключ": 1}]},
+        {"ratio": 1e16, "tiny": 2.5e-05, "plain": [1.5, 2**70]},
+        {"plain": {"b": [1, 0.25], "a": None}, "flag": True},
+    ],
+)
+@pytest.mark.parametrize("sort_keys", [False, True])
+def test_write_json_matches_stdlib_with_orjson(
+    tmp_path: Path, payload: dict, sort_keys: bool
+) -> None:
+    pytest.importorskip("orjson")
+    output = tmp_path / "out.json"
+
+    _write_json(payload, output=output, indent=2, sort_keys=sort_keys)
+
+    expected = json.dumps(payload, indent=2, sort_keys=sort_keys) + "\n"
+    assert output.read_bytes() == expected.encode("utf-8")
+
+
+def test_orjson_dumps_rejects_payloads_it_would_render_differently() -> None:
+    pytest.importorskip("orjson")
+
+    assert profile_cli._orjson_dumps({"a": [1, 0.5]}, indent=2, sort_keys=False) is not None
+    for payload in ({"v": float("nan")}, {"v": "café"}, {"v": 1e16}, {1: "int key"}):
+        assert profile_cli._orjson_dumps(payload, indent=2, sort_keys=False) is None
+
+
+def test_write_json_stdout_keeps_text_layer(monkeypatch) -> None:
+    pytest.importorskip("orjson")
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8", newline="\r\n")
+    monkeypatch.setattr(sys, "stdout", stream)
+    payload = {"items": [1, 2], "value": float("nan")}
+
+    _write_json({"items": [1, 2]}, output=None, indent=2, sort_keys=False)
+    _write_json(payload, output=None, indent=2, sort_keys=False)
+    stream.flush()
+
+    expected = (json.dumps({"items": [1, 2]}, indent=2) + "\n" + json.dumps(payload, indent=2) + "\n")
+    assert raw.getvalue() == expected.replace("\n", "\r\n").encode("utf-8")
+
+
+def _bridge_relatives(entries: list[dict], root: Path) -> list[str | None]:
+    store = ProfileStore([ConfigurationProfile(name="demo", configs=())])
+    payload = _build_bridge_payload(store, entries, tags=None, root=root)
+    return [item["relative_path"] for item in payload["items"]]
+
+
+def test_build_bridge_payload_normalises_paths_and_root() -> None:
+    relatives = _bridge_relatives(
+        [
+            {"path": "./deploy//web/conf/./app.json"},
+            {"path": "deploy/web"},
+            {"path": "deploy/web/"},
+            {"path": "deploy/webapp/app.json"},
+            {"path": "DEPLOY/web/case.txt"},
+        ],
+        root=Path("./deploy//web/"),
+    )
+    assert relatives == ["conf/app.json", ".", ".", "app.json", "case.txt"]
+
+    assert _bridge_relatives([{"path": "/srv/app.log"}], root=Path("/")) == ["srv/app.log"]
+    assert _bridge_relatives([{"path": "logs/a.log"}, {"path": "/abs/b.log"}], root=Path(".")) == [
+        "logs/a.log",
+        "b.log",
+    ]
+
+
+def test_build_bridge_payload_matches_root_case_insensitively_on_windows(monkeypatch) -> None:
+    monkeypatch.setattr(profile_cli, "_CASE_INSENSITIVE_PATHS", True)
+
+    relatives = _bridge_relatives(
+        [{"path": "c:\\deploy\\WEB\\Logs\\App.log"}, {"path": "C:\\Deploy\\Web"}],
+        root=Path("C:/Deploy/Web"),
+    )
+    assert relatives == ["Logs/App.log", "."]
+
+
+def test_ensure_hunt_array_skips_bom_and_long_whitespace(tmp_path: Path) -> None:
+    path = tmp_path / "hunts.json"
+    prefix = b"\xef\xbb\xbf" + b" \r\n\t" * 5000
+    path.write_bytes(prefix + b'[{"path": "a"}]')
+    assert profile_cli._ensure_hunt_array(path) == len(prefix)
+
+    path.write_bytes(b"\n" * 10000 + b'{"path": "a"}')
+    with pytest.raises(ValueError, match="JSON array"):
+        profile_cli._ensure_hunt_array(path)
+
+    path.write_bytes(b"\xef\xbb\xbf   ")
+    with pytest.raises(ValueError, match="JSON array"):
+        profile_cli._ensure_hunt_array(path)
+
+
+def test_iter_hunt_entries_streams_with_ijson(tmp_path: Path) -> None:
+    pytest.importorskip("ijson")
+    path = tmp_path / "hunts.json"
+    path.write_bytes(
+        b"\xef\xbb\xbf"
+        + b" \n" * 40000
+        + json.dumps([{"path": "a", "score": 0.5}, "skip", {"path": "b"}]).encode("utf-8")
+    )
+
+    assert list(profile_cli._iter_hunt_entries(path)) == [{"path": "a", "score": 0.5}, {"path": "b"}]
+
+    path.write_text('{"path": "a"}', encoding="utf-8")
+    with pytest.raises(ValueError, match="JSON array"):
+        profile_cli._iter_hunt_entries(path)
@@ -153,3 +153,58 @@ def test_profile_store_matching_configs_returns_indexed_results() -> None:
     result = store.matching_configs(tags=None, relative_path="whatever")
     assert isinstance(result[0], AppliedProfileConfig)
     assert store.find_config("missing") == ()
+
+
+def test_profile_store_prepare_index_matches_matching_configs() -> None:
+    store = ProfileStore(
+        [
+            ConfigurationProfile(
+                name="web",
+                tags={"prod"},
+                configs=(
+                    ProfileConfig(identifier="web-any"),
+                    ProfileConfig(identifier="web-json", path_glob="configs/*.json"),
+                    ProfileConfig(
+                        identifier="web-app",
+                        path="configs/app.json",
+                        path_glob="legacy/*.json",
+                    ),
+                    ProfileConfig(identifier="web-api", path="api.json", application="api"),
+                ),
+            ),
+            ConfigurationProfile(
+                name="batch",
+                configs=(
+                    ProfileConfig(identifier="batch-app", path="configs/app.json"),
+                    ProfileConfig(identifier="batch-dev", path="dev.json", tags={"dev"}),
+                ),
+            ),
+            ConfigurationProfile(
+                name="dev-only",
+                tags={"dev"},
+                configs=(ProfileConfig(identifier="dev-any"),),
+            ),
+        ]
+    )
+
+    for tags in (None, ["prod"], ["prod", "application:api", "dev"]):
+        index = store.prepare_index(tags)
+        for relative in (
+            None,
+            "configs/app.json",
+            "configs/./other.json",
+            "legacy/app.json",
+            "api.json",
+            "dev.json",
+            "missing.txt",
+        ):
+            expected = store.matching_configs(tags, relative_path=relative)
+            assert index.match(relative) == expected
+
+    ordered = store.prepare_index(["prod"]).match("configs/app.json")
+    assert [applied.config.identifier for applied in ordered] == [
+        "web-any",
+        "web-json",
+        "web-app",
+        "batch-app",
+    ]
@@ -19,6 +19,25 @@ def test_parse_registry_root_descriptor_variants():
     assert auto.hive == "HKCU"
     assert auto.view is None
 
+    lowered = parse_registry_root_descriptor(" hkcu/Software/Tool ")
+    assert lowered.hive == "HKCU"
+    assert lowered.path == "Software\\Tool"
+
+
+@pytest.mark.parametrize(
+    "descriptor, message",
+    [
+        ("HKCR\\Software", "must start with"),
+        ("HKLM\\", "must start with"),
+        ("HKLM", "must start with"),
+        ("HKLM\\Software,view", "key=value"),
+        ("HKLM\\Software,view=16", "32, 64, or auto"),
+    ],
+)
+def test_parse_registry_root_descriptor_rejects_invalid(descriptor: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        parse_registry_root_descriptor(descriptor)
+
 
 def test_registry_cli_emit_config_with_roots(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
     monkeypatch.setattr(registry_cli, "is_windows", lambda: True)
@@ -82,7 +82,7 @@ def test_registry_cli_search(monkeypatch: pytest.MonkeyPatch, capsys: pytest.Cap
             self.data_preview = "api.internal.local"
             self.reason = "keyword/pattern match"
 
-    monkeypatch.setattr(cli, "search_registry", lambda roots, spec: (Hit(),))
+    monkeypatch.setattr(cli, "iter_search_registry", lambda roots, spec: iter((Hit(),)))
 
     rc = run_main(cli, [
         "search",
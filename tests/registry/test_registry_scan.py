@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+import threading
 from typing import Dict, List, Optional, Tuple
 
 import pytest
@@ -177,3 +178,316 @@ def test_default_backend_guard(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(scan, "is_windows", lambda: False)
     with pytest.raises(RuntimeError):
         scan.enumerate_installed_apps(backend=None)
+
+
+def test_enumerate_installed_apps_reads_values_concurrently(monkeypatch):
+    from driftbuster.registry import scan
+
+    fb = build_fake_registry()
+    barrier = threading.Barrier(2, timeout=5)
+    enum_values = fb.enum_values
+
+    def rendezvous(hive: str, path: str, view: Optional[str]):
+        # The two HKLM apps can only pass the barrier together, which fails
+        # if value reads were issued one after another.
+        if path.endswith(("\\AppA", "\\AppB")):
+            barrier.wait()
+        return enum_values(hive, path, view)
+
+    fb.enum_values = rendezvous  # type: ignore[method-assign]
+    # Only the built-in backend is read concurrently.
+    monkeypatch.setattr(scan, "_default_backend", lambda: fb)
+    apps = enumerate_installed_apps()
+    assert [a.display_name for a in apps] == ["TinyTool", "VendorA AppA", "VendorB AppB"]
+    assert [a.view for a in apps] == ["auto", "64", "32"]
+
+
+def test_cached_backend_memoises_until_ttl_expires():
+    from driftbuster.registry.scan import _CachedBackend
+
+    fb = build_fake_registry()
+    calls: List[Tuple[str, str]] = []
+    enum_subkeys, enum_values = fb.enum_subkeys, fb.enum_values
+
+    def counting_subkeys(hive: str, path: str, view: Optional[str]):
+        calls.append(("subkeys", path))
+        return enum_subkeys(hive, path, view)
+
+    def counting_values(hive: str, path: str, view: Optional[str]):
+        calls.append(("values", path))
+        return enum_values(hive, path, view)
+
+    fb.enum_subkeys = counting_subkeys  # type: ignore[method-assign]
+    fb.enum_values = counting_values  # type: ignore[method-assign]
+    now = [0.0]
+    cached = _CachedBackend(fb, ttl_s=10.0, clock=lambda: now[0])
+
+    first = enumerate_installed_apps(backend=cached)
+    calls_after_first = len(calls)
+    assert enumerate_installed_apps(backend=cached) == first
+    assert len(calls) == calls_after_first
+
+    roots = (("HKLM", r"Software\VendorA\AppA", None),)
+    spec = SearchSpec(keywords=("server",))
+    assert search_registry(roots, spec, backend=cached) == search_registry(roots, spec, backend=cached)
+    assert calls.count(("values", r"Software\VendorA\AppA\Settings")) == 1
+
+    now[0] = 11.0
+    enumerate_installed_apps(backend=cached)
+    assert len(calls) > calls_after_first + 2
+
+    listing = cached.enum_subkeys("HKLM", r"Software\VendorA\AppA", None)
+    listing.append("mutated")
+    assert "mutated" not in cached.enum_subkeys("HKLM", r"Software\VendorA\AppA", None)
+    cached.clear()
+    cached.enum_subkeys("HKLM", r"Software\VendorA\AppA", None)
+    assert calls[-1] == ("subkeys", r"Software\VendorA\AppA")
+
+    tiny = _CachedBackend(fb, maxsize=1, clock=lambda: now[0])
+    tiny.enum_values("HKCU", r"Software\TinyTool", None)
+    tiny.enum_values("HKLM", r"Software\VendorA\AppA", None)
+    tiny.enum_values("HKCU", r"Software\TinyTool", None)
+    assert calls.count(("values", r"Software\TinyTool")) == 2
+
+
+def test_keyword_matcher_requires_every_keyword():
+    from driftbuster.registry.scan import _keyword_matcher
+
+    many = _keyword_matcher(("alpha", "beta", "gamma", "delta", "beta", ""))
+    assert many("delta gamma beta alpha")
+    assert many("alphabetagammadelta")
+    assert not many("alpha beta gamma")
+
+    few = _keyword_matcher(("server",))
+    assert few("servername value")
+    assert not few("host value")
+    assert _keyword_matcher(())("anything")
+
+
+def test_pattern_matcher_combines_compatible_patterns():
+    from driftbuster.registry.scan import _pattern_matcher
+
+    assert _pattern_matcher(()) is None
+
+    combined = _pattern_matcher((re.compile(r"srv-\d+"), re.compile(r"^db$")))
+    assert combined("host srv-42")
+    assert combined("db")
+    assert not combined("db1")
+
+    # Mixed flags and grouped patterns fall back to scanning one at a time.
+    mixed = _pattern_matcher((re.compile(r"api", re.IGNORECASE), re.compile(r"(x)\1")))
+    assert mixed("API")
+    assert mixed("xx")
+    assert not mixed("xy")
+
+
+@pytest.mark.parametrize(
+    "kind, raw, expected",
+    [
+        (1, "Contoso\0".encode("utf-16-le"), "Contoso"),
+        (2, "%ProgramFiles%\\App\0junk".encode("utf-16-le"), "%ProgramFiles%\\App"),
+        (7, "a\0b\0\0".encode("utf-16-le"), ["a", "b"]),
+        (4, (42).to_bytes(4, "little"), 42),
+        (11, (1 << 40).to_bytes(8, "little"), 1 << 40),
+        (3, b"\x01\x02", b"\x01\x02"),
+        (3, b"", None),
+        (4, b"", 0),
+    ],
+)
+def test_decode_reg_value_matches_winreg_types(kind, raw, expected):
+    from driftbuster.registry.scan import _decode_reg_value
+
+    assert _decode_reg_value(kind, raw) == expected
+
+
+def test_enumerate_installed_apps_reads_custom_backends_on_calling_thread():
+    threads: set[int] = set()
+
+    class RecordingBackend(FakeBackend):
+        def enum_subkeys(self, hive, path, view):
+            threads.add(threading.get_ident())
+            return super().enum_subkeys(hive, path, view)
+
+        def enum_values(self, hive, path, view):
+            threads.add(threading.get_ident())
+            return super().enum_values(hive, path, view)
+
+    fb = RecordingBackend()
+    fb.add_key(
+        "HKLM",
+        r"Software\Microsoft\Windows\CurrentVersion\Uninstall\AppOne",
+        values={"DisplayName": "App One"},
+    )
+    fb.add_key(
+        "HKCU",
+        r"Software\Microsoft\Windows\CurrentVersion\Uninstall\AppTwo",
+        values={"DisplayName": "App Two"},
+    )
+
+    apps = enumerate_installed_apps(backend=fb)
+
+    assert [app.display_name for app in apps] == ["App One", "App Two"]
+    assert threads == {threading.get_ident()}
+
+
+def test_search_registry_strategy_controls_visit_order():
+    fb = FakeBackend()
+    fb.add_key("HKCU", r"Software\Tree\A", values={"v": "on-a"})
+    fb.add_key("HKCU", r"Software\Tree\A\Deep", values={"v": "on-deep"})
+    fb.add_key("HKCU", r"Software\Tree\B", values={"v": "on-b"})
+    roots = [("HKCU", r"Software\Tree", None)]
+    spec = SearchSpec(patterns=(re.compile(r"on"),))
+
+    dfs = search_registry(roots, spec, backend=fb)
+    assert [hit.data_preview for hit in dfs] == ["on-a", "on-deep", "on-b"]
+
+    bfs = search_registry(roots, SearchSpec(patterns=spec.patterns, strategy="bfs"), backend=fb)
+    assert [hit.data_preview for hit in bfs] == ["on-a", "on-b", "on-deep"]
+
+    with pytest.raises(ValueError):
+        search_registry(roots, SearchSpec(strategy="random"), backend=fb)
+
+
+def test_search_registry_dfs_reexpands_keys_reached_from_shallower_roots():
+    fb = FakeBackend()
+    fb.add_key("HKLM", r"Soft\App\A", values={"v": "hit-a"})
+    fb.add_key("HKLM", r"Soft\App\A\B")
+    fb.add_key("HKLM", r"Soft\App\A\B\C", values={"v": "hit-deep"})
+    fb.add_key("HKLM", r"Soft\App\Z", values={"v": "hit-shallow"})
+    # DFS reaches A\B from the first root at the depth limit; the second
+    # root must still expand it with a fresh budget.
+    roots = [("HKLM", r"Soft\App", None), ("HKLM", r"Soft\App\A", None)]
+    patterns = (re.compile(r"hit"),)
+
+    for strategy in ("dfs", "bfs"):
+        hits = search_registry(roots, SearchSpec(patterns=patterns, max_depth=2, strategy=strategy), backend=fb)
+        assert sorted(hit.data_preview for hit in hits) == ["hit-a", "hit-deep", "hit-shallow"]
+
+
+def test_search_registry_prune_skips_values_off_keyword_paths():
+    fb = FakeBackend()
+    base = r"Software\Vendor"
+    fb.add_key("HKLM", base + r"\A")
+    fb.add_key("HKLM", base + r"\A\B")
+    fb.add_key("HKLM", base + r"\A\B\C", values={"Host": "server-off-path"})
+    fb.add_key("HKLM", base + r"\A\B\Server", values={"Host": "server-on-path"})
+    roots = [("HKLM", base, None)]
+
+    full = search_registry(roots, SearchSpec(keywords=("server",)), backend=fb)
+    assert sorted(hit.data_preview for hit in full) == ["server-off-path", "server-on-path"]
+
+    pruned = search_registry(roots, SearchSpec(keywords=("server",), prune=True), backend=fb)
+    assert [hit.data_preview for hit in pruned] == ["server-on-path"]
+
+
+def test_search_registry_prune_reads_values_when_key_is_reached_shallower():
+    fb = FakeBackend()
+    base = r"Software\Vendor"
+    fb.add_key("HKLM", base + r"\A")
+    fb.add_key("HKLM", base + r"\A\B")
+    fb.add_key("HKLM", base + r"\A\B\C")
+    fb.add_key("HKLM", base + r"\A\B\C\D", values={"Host": "server-deep"})
+    roots = [("HKLM", base, None), ("HKLM", base + r"\A\B\C", None)]
+
+    hits = search_registry(roots, SearchSpec(keywords=("server",), prune=True), backend=fb)
+    assert [hit.data_preview for hit in hits] == ["server-deep"]
+
+
+def test_value_matcher_variants_share_semantics():
+    from driftbuster.registry.scan import _keyword_matcher, _pattern_matcher, _value_matcher
+
+    keywords = _keyword_matcher(("server",))
+    patterns = _pattern_matcher((re.compile(r"\d+"),))
+
+    assert _value_matcher(None, None)("Any", b"raw") == "raw"
+    assert _value_matcher(None, None)("Any", object()) is None
+    assert _value_matcher(keywords, None)("ServerPort", 8080) == "8080"
+    assert _value_matcher(keywords, None)("Port", 8080) is None
+    assert _value_matcher(None, patterns)("Port", ["a", 1]) == "a, 1"
+    assert _value_matcher(None, patterns)("Port", "none") is None
+    assert _value_matcher(keywords, patterns)("Server", "host-1") == "host-1"
+    assert _value_matcher(keywords, patterns)("Server", "host") is None
+
+
+def test_iter_search_registry_yields_before_walking_the_whole_tree():
+    from driftbuster.registry.scan import iter_search_registry
+
+    fb = build_fake_registry()
+    fb.add_key("HKLM", r"Software\VendorA\AppA\Zeta", values={"Server": "backup.internal.local"})
+    visited: List[str] = []
+    original = fb.enum_values
+
+    def _tracking(hive, path, view):
+        visited.append(path)
+        return original(hive, path, view)
+
+    fb.enum_values = _tracking  # type: ignore[assignment]
+    roots = [("HKLM", r"Software\VendorA\AppA", None)]
+    hits = iter_search_registry(roots, SearchSpec(keywords=("server",)), backend=fb)
+    first = next(hits)
+    assert first.value_name
+    assert first.data_preview == "api.internal.local"
+    assert visited == [r"Software\VendorA\AppA", r"Software\VendorA\AppA\Settings"]
+    assert tuple(hits) == search_registry(roots, SearchSpec(keywords=("server",)), backend=fb)[1:]
+
+
+def test_find_app_registry_roots_validate_drops_missing_keys():
+    fb = build_fake_registry()
+    apps = enumerate_installed_apps(backend=fb)
+    candidates = find_app_registry_roots("AppA", installed=apps)
+    validated = find_app_registry_roots("AppA", installed=apps, validate=True, backend=fb)
+
+    assert ("HKLM", r"Software\VendorA\AppA", "64") in validated
+    assert ("HKCU", r"Software\VendorA\AppA", None) not in validated
+    assert set(validated) < set(candidates)
+    assert [root for root in candidates if root in validated] == list(validated)
+
+
+def test_find_app_registry_roots_validates_custom_backends_on_calling_thread():
+    fb = build_fake_registry()
+    apps = enumerate_installed_apps(backend=fb)
+    threads: set[int] = set()
+    enum_subkeys = fb.enum_subkeys
+
+    def recording_subkeys(hive: str, path: str, view: Optional[str]):
+        threads.add(threading.get_ident())
+        return enum_subkeys(hive, path, view)
+
+    fb.enum_subkeys = recording_subkeys  # type: ignore[method-assign]
+    assert find_app_registry_roots("AppA", installed=apps, validate=True, backend=fb)
+    assert threads == {threading.get_ident()}
+
+
+def test_enumerate_installed_apps_orders_same_name_by_hive():
+    fb = FakeBackend()
+    base = r"Software\Microsoft\Windows\CurrentVersion\Uninstall"
+    fb.add_key("HKLM", base + r"\Shared", values={"DisplayName": "shared tool"})
+    fb.add_key("HKCU", base + r"\Shared", values={"DisplayName": "Shared Tool"})
+    fb.add_key("HKLM", base + r"\Alpha", values={"DisplayName": "Alpha"})
+
+    apps = enumerate_installed_apps(backend=fb)
+    assert [(app.display_name, app.hive) for app in apps] == [
+        ("Alpha", "HKLM"),
+        ("Shared Tool", "HKCU"),
+        ("shared tool", "HKLM"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("plain", "plain"),
+        (b"caf\xc3\xa9", "café"),
+        (7, "7"),
+        (True, "True"),
+        (1.5, "1.5"),
+        (["a", 2], "a, 2"),
+        (("x",), "x"),
+        (None, None),
+        ({"k": "v"}, None),
+    ],
+)
+def test_value_text_decodes_supported_types(value, expected):
+    from driftbuster.registry.scan import _value_text
+
+    assert _value_text(value) == expected
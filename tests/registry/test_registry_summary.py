@@ -1,19 +1,36 @@
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
 import pytest
 
 from driftbuster.registry import (
     SearchSpec,
+    disable_registry_profiling,
+    enable_registry_profiling,
     enumerate_installed_apps,
     find_app_registry_roots,
+    iter_search_registry,
     registry_summary,
     search_registry,
 )
+from driftbuster import registry as registry_module
+from driftbuster.registry import _format_timestamp
 
 
 _UNINSTALL_PATH = r"Software\Microsoft\Windows\CurrentVersion\Uninstall"
 
 
+@pytest.fixture(autouse=True)
+def _profiling_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(registry_module, "_INSTRUMENTATION_ENABLED", True)
+
+
 class _RecordingBackend:
     def __init__(self) -> None:
         self._subkeys = {
@@ -73,6 +90,9 @@ def test_registry_summary_tracks_usage_statistics() -> None:
     assert enumerate_stats["avg_duration_ms"] >= 0.0
     assert enumerate_stats["first_invocation"] is not None
     assert enumerate_stats["last_invocation"] is not None
+    assert enumerate_stats["first_invocation"] <= enumerate_stats["last_invocation"]
+    first_seen = datetime.fromisoformat(enumerate_stats["first_invocation"].replace("Z", "+00:00"))
+    assert abs((datetime.now(timezone.utc) - first_seen).total_seconds()) < 60
 
     search_stats = summary["search_registry"]
     assert search_stats["calls"] == 1
@@ -100,3 +120,106 @@ def test_registry_summary_records_errors_and_reset() -> None:
     reset_summary = {entry["operation"]: entry for entry in registry_summary()}
     assert reset_summary["search_registry"]["calls"] == 0
     assert reset_summary["search_registry"]["errors"] == 0
+
+
+def test_registry_profiling_can_be_disabled() -> None:
+    registry_summary(reset=True)
+    backend = _RecordingBackend()
+
+    disable_registry_profiling()
+    try:
+        assert len(enumerate_installed_apps(backend=backend)) == 1
+        with pytest.raises(RuntimeError):
+            search_registry((("HKLM", "Software\\Broken", None),), SearchSpec(), backend=_FailingBackend())
+    finally:
+        enable_registry_profiling()
+
+    summary = {entry["operation"]: entry for entry in registry_summary()}
+    assert summary["enumerate_installed_apps"]["calls"] == 0
+    assert summary["search_registry"]["errors"] == 0
+
+
+def test_registry_summary_does_not_start_tracking() -> None:
+    registry_summary(reset=True)
+    backend = _RecordingBackend()
+
+    disable_registry_profiling()
+    registry_summary()
+    enumerate_installed_apps(backend=backend)
+    summary = {entry["operation"]: entry for entry in registry_summary()}
+    assert summary["enumerate_installed_apps"]["calls"] == 0
+
+    enable_registry_profiling()
+    enumerate_installed_apps(backend=backend)
+    summary = {entry["operation"]: entry for entry in registry_summary(reset=True)}
+    assert summary["enumerate_installed_apps"]["calls"] == 1
+
+
+@pytest.mark.parametrize(
+    "value_ns, expected",
+    [
+        (None, None),
+        (1_700_000_000_000_000_000, "2023-11-14T22:13:20Z"),
+        (1_700_000_000_123_456_789, "2023-11-14T22:13:20.123456Z"),
+    ],
+)
+def test_format_timestamp_matches_isoformat(value_ns, expected) -> None:
+    assert _format_timestamp(value_ns) == expected
+    if value_ns is not None:
+        reference = datetime.fromtimestamp(value_ns // 1000 / 1e6, tz=timezone.utc)
+        assert expected == reference.isoformat().replace("+00:00", "Z")
+
+
+def test_registry_package_imports_scan_lazily() -> None:
+    src = Path(__file__).resolve().parents[2] / "src"
+    script = (
+        "import sys\n"
+        "import driftbuster.registry as registry\n"
+        "registry.parse_registry_root_descriptor('HKLM\\\\Software\\\\Vendor')\n"
+        "assert 'driftbuster.registry.scan' not in sys.modules\n"
+        "assert registry.search_registry is registry.search_registry\n"
+        "assert 'driftbuster.registry.scan' in sys.modules\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        env={**os.environ, "PYTHONPATH": str(src)},
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_registry_summary_timestamps_follow_wall_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    registry_summary(reset=True)
+    backend = _RecordingBackend()
+    enumerate_installed_apps(backend=backend)
+    # Simulate the wall clock stepping forward (suspend/NTP) between calls.
+    stepped_ns = 1_900_000_000_123_456_000
+    monkeypatch.setattr(time, "time_ns", lambda: stepped_ns)
+    enumerate_installed_apps(backend=backend)
+
+    stats = {entry["operation"]: entry for entry in registry_summary()}["enumerate_installed_apps"]
+    assert stats["last_invocation"] == _format_timestamp(stepped_ns)
+    assert stats["first_invocation"] < stats["last_invocation"]
+
+
+def test_iter_search_registry_counts_towards_search_registry() -> None:
+    registry_summary(reset=True)
+    backend = _RecordingBackend()
+    root = ("HKCU", "Software\\ExampleApp", None)
+    spec = SearchSpec(keywords=("example",), max_depth=0, max_hits=5)
+
+    hits = list(iter_search_registry((root,), spec, backend=backend))
+    assert hits
+    stream = iter_search_registry((root,), SearchSpec(max_depth=0), backend=backend)
+    next(stream)
+    stream.close()
+    with pytest.raises(RuntimeError):
+        list(iter_search_registry((root,), spec, backend=_FailingBackend()))
+
+    stats = {entry["operation"]: entry for entry in registry_summary()}["search_registry"]
+    assert stats["calls"] == 3
+    assert stats["successes"] == 2
+    assert stats["errors"] == 1
+    assert stats["last_error"].startswith("RuntimeError")
@@ -59,3 +59,33 @@ def test_canonicalise_xml_strips_bom_prefix() -> None:
     result = canonicalise_xml(payload)
     assert not result.startswith("\ufeff")
     assert result == "<?xml version='1.0'?>\n<root> value </root>"
+
+
+
+def test_canonicalise_xml_normalises_every_nested_element() -> None:
+    depth = 200
+    payload = "<n b='2' a=' '>\n  " * depth + "leaf</n>" + "\n</n>" * (depth - 1)
+
+    result = canonicalise_xml(payload)
+
+    assert result == '<n a="" b="2">' * (depth - 1) + '<n a="" b="2">\n  leaf' + "</n>" * depth
+
+
+def test_canonicalise_xml_doctype_with_nested_brackets() -> None:
+    payload = (
+        "<!doctype note [ <!ENTITY a \"[x]\"> [ ] ]>\n"
+        "<note>  </note>"
+    )
+
+    assert canonicalise_xml(payload).startswith("<!doctype note [ <!ENTITY a \"[x]\"> [ ] ]>\n")
+
+
+def test_canonicalise_xml_unterminated_doctype_falls_back_to_text() -> None:
+    payload = "<!DOCTYPE note [ <!ELEMENT note ANY>\n<note/>  "
+
+    assert canonicalise_xml(payload) == canonicalise_text(payload)
+
+
+def test_canonicalise_xml_keeps_comments_only_when_present() -> None:
+    assert canonicalise_xml("<a><!-- keep --><b/></a>") == "<a><!-- keep --><b /></a>"
+    assert canonicalise_xml("<a>\n  <b z='1' y='2'/>\n</a>") == '<a><b y="2" z="1" /></a>'
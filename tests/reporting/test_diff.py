@@ -1,8 +1,12 @@
+from datetime import datetime, timezone
+from hashlib import sha256
+
 import pytest
 
 from driftbuster.reporting.diff import (
     build_unified_diff,
     diff_summary_to_payload,
+    summarise_diff_result,
     summarise_diff_results,
 )
 
@@ -40,3 +44,125 @@ def test_summarise_diff_results_validates_lengths() -> None:
 
     with pytest.raises(ValueError):
         summarise_diff_results(())
+
+
+def test_summarise_diff_results_digests_match_joined_payloads() -> None:
+    result = build_unified_diff("caf\u00e9\nvalue=1\n", "caf\u00e9\nvalue=2\n")
+
+    summary = summarise_diff_results((result,)).comparisons[0].summary
+
+    def digest(text: str) -> str:
+        return f"sha256:{sha256(text.encode('utf-8')).hexdigest()}"
+
+    assert summary.before_digest == digest(result.canonical_before)
+    assert summary.after_digest == digest(result.canonical_after)
+    assert summary.diff_digest == digest(f"{result.canonical_before}\n---\n{result.canonical_after}")
+
+
+@pytest.mark.parametrize(
+    ("before", "after", "content_type"),
+    [
+        ("a\nb\n", "a\nc\n  ", "text"),
+        ("x\r\ny ", "\n\n", "text"),
+        ('{"b": 1, "a": [1, 2]}', "{}", "json"),
+        ("<a><b/></a>", "<a>\n  <c/>\n</a>", "xml"),
+    ],
+)
+def test_summarise_diff_results_line_counts_match_canonical_payloads(
+    before: str, after: str, content_type: str
+) -> None:
+    result = build_unified_diff(before, after, content_type=content_type)
+
+    summary = summarise_diff_results((result,)).comparisons[0].summary
+
+    assert result._before_line_count is not None
+    assert summary.before_lines == len(result.canonical_before.splitlines())
+    assert summary.after_lines == len(result.canonical_after.splitlines())
+
+
+def _spy_summary_pool(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    from driftbuster.reporting import diff as diff_module
+
+    pools: list[int] = []
+    executor = diff_module.ThreadPoolExecutor
+
+    def spy(max_workers: int):
+        pools.append(max_workers)
+        return executor(max_workers=max_workers)
+
+    monkeypatch.setattr(diff_module.os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(diff_module, "ThreadPoolExecutor", spy)
+    return pools
+
+
+def test_summarise_diff_results_parallel_batch_keeps_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    from driftbuster.reporting import diff as diff_module
+
+    pools = _spy_summary_pool(monkeypatch)
+    padding = "x" * diff_module._SUMMARY_PARALLEL_MIN_TEXT_CHARS
+    results = [
+        build_unified_diff(f"{padding}\nvalue={index}\n", f"{padding}\nvalue={index + 1}\n", to_label=f"host{index}")
+        for index in range(diff_module._SUMMARY_PARALLEL_MIN_RESULTS + 4)
+    ]
+
+    summary = summarise_diff_results(results, baseline_names=[f"base{i}" for i in range(len(results))])
+
+    assert pools == [4]
+    assert [comparison.to_label for comparison in summary.comparisons] == [
+        result.to_label for result in results
+    ]
+    assert summary.comparisons[-1].metadata.baseline_name == f"base{len(results) - 1}"
+
+
+def test_summarise_diff_results_keeps_small_payload_batches_inline(monkeypatch: pytest.MonkeyPatch) -> None:
+    from driftbuster.reporting import diff as diff_module
+
+    pools = _spy_summary_pool(monkeypatch)
+    results = [
+        build_unified_diff(f"value={index}\n", f"value={index + 1}\n", to_label=f"host{index}")
+        for index in range(diff_module._SUMMARY_PARALLEL_MIN_RESULTS + 4)
+    ]
+
+    summary = summarise_diff_results(results)
+
+    assert pools == []
+    assert [comparison.to_label for comparison in summary.comparisons] == [
+        result.to_label for result in results
+    ]
+
+
+def test_summarise_diff_results_accepts_shared_timestamp() -> None:
+    stamp = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    result = build_unified_diff("a", "b")
+
+    assert summarise_diff_result(result, generated_at=stamp).generated_at == stamp
+    assert summarise_diff_results((result,), generated_at=stamp).generated_at == stamp
+    assert summarise_diff_results((result,)).generated_at.tzinfo is timezone.utc
+
+
+def test_summarise_diff_results_reuses_baseline_hash() -> None:
+    from driftbuster.reporting import diff as diff_module
+
+    diff_module._payload_hash_cached.cache_clear()
+    results = [build_unified_diff("base\n", f"candidate{index}\n") for index in range(3)]
+
+    first = summarise_diff_results(results)
+    second = summarise_diff_results(results)
+
+    assert diff_module._payload_hash_cached.cache_info().misses == 4
+    assert [c.summary for c in first.comparisons] == [c.summary for c in second.comparisons]
+
+
+def test_summarise_diff_results_skips_hash_cache_for_large_payloads(monkeypatch) -> None:
+    from driftbuster.reporting import diff as diff_module
+
+    diff_module._payload_hash_cached.cache_clear()
+    monkeypatch.setattr(diff_module, "_CANONICAL_CACHE_MAX_CHARS", 16)
+    baseline = "baseline line\n" * 4
+    results = [build_unified_diff(baseline, f"c{index}\n") for index in range(2)]
+
+    summary = summarise_diff_results(results)
+
+    assert diff_module._payload_hash_cached.cache_info().currsize == 2
+    digests = {c.summary.before_digest for c in summary.comparisons}
+    assert digests == {"sha256:" + sha256(results[0].canonical_before.encode("utf-8")).hexdigest()}
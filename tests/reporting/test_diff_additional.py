@@ -61,3 +61,72 @@ def test_calculate_stats_counts_deletions() -> None:
     result = build_unified_diff(before, after)
     # Ensure the deletion branch is exercised
     assert result.stats["removed_lines"] >= 1
+
+
+def test_unified_diff_with_stats_matches_difflib() -> None:
+    import random
+    from difflib import unified_diff
+
+    from driftbuster.reporting.diff import _calculate_stats, _unified_diff_with_stats
+
+    rng = random.Random(7)
+    for _ in range(200):
+        before = [rng.choice("abcde") for _ in range(rng.randint(0, 15))]
+        after = [rng.choice("abcde") for _ in range(rng.randint(0, 15))]
+        context = rng.randint(0, 3)
+        text, stats = _unified_diff_with_stats(
+            before, after, from_label="old", to_label="new", context_lines=context
+        )
+        expected = "\n".join(
+            unified_diff(before, after, fromfile="old", tofile="new", lineterm="", n=context)
+        )
+        assert text == expected
+        assert stats == _calculate_stats(before, after)
+
+
+def test_build_unified_diff_identical_payloads_skip_matching(monkeypatch) -> None:
+    import driftbuster.reporting.diff as diff_module
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("SequenceMatcher should not run for identical input")
+
+    monkeypatch.setattr(diff_module, "SequenceMatcher", _fail)
+    result = build_unified_diff("same \r\nlines\n", "same\nlines\n", mask_tokens=("lines",))
+
+    assert result.diff == ""
+    assert result.stats == {"added_lines": 0, "removed_lines": 0, "changed_lines": 0}
+    assert result.redaction_counts == {"lines": 2}
+
+
+def test_build_unified_diff_reuses_cached_baseline(monkeypatch) -> None:
+    import driftbuster.reporting.diff as diff_module
+
+    diff_module._canonicalise_cached.cache_clear()
+    calls: list[str] = []
+    original = diff_module._NORMALISERS["json"]
+    monkeypatch.setitem(
+        diff_module._NORMALISERS, "json", lambda payload: calls.append(payload) or original(payload)
+    )
+
+    baseline = '{"b": 1, "a": 2}'
+    first = build_unified_diff(baseline, '{"a": 2, "b": 3}', content_type="json")
+    second = build_unified_diff(baseline, '{"a": 2}', content_type="json")
+
+    assert calls.count(baseline) == 1
+    assert first.stats["changed_lines"] == 1
+    assert second.diff
+    diff_module._canonicalise_cached.cache_clear()
+
+
+def test_build_unified_diff_skips_cache_for_large_payloads(monkeypatch) -> None:
+    import driftbuster.reporting.diff as diff_module
+
+    diff_module._canonicalise_cached.cache_clear()
+    monkeypatch.setattr(diff_module, "_CANONICAL_CACHE_MAX_CHARS", 16)
+
+    large = "line\n" * 8
+    result = build_unified_diff(large, "small\n")
+
+    assert diff_module._canonicalise_cached.cache_info().currsize == 1
+    assert result.canonical_before == large
+    diff_module._canonicalise_cached.cache_clear()
@@ -104,6 +104,27 @@ def test_build_binary_diff_tracks_evidence() -> None:
     assert evidence.after_size == 3
 
 
+def test_build_binary_diff_identical_payloads_share_digest(monkeypatch: pytest.MonkeyPatch) -> None:
+    from driftbuster.reporting import diff as diff_module
+
+    calls: list[bytes] = []
+    original = diff_module._digest_bytes
+
+    def _counting_digest(payload: bytes) -> str:
+        calls.append(payload)
+        return original(payload)
+
+    monkeypatch.setattr(diff_module, "_digest_bytes", _counting_digest)
+
+    result = build_binary_diff(b"same", b"same")
+
+    assert len(calls) == 1
+    assert result.canonical_before == result.canonical_after
+    assert result.stats["changed_lines"] == 0
+    assert result.binary_evidence is not None
+    assert result.binary_evidence[0].changed is False
+
+
 def test_build_unified_diff_truncates_large_payloads(monkeypatch: pytest.MonkeyPatch) -> None:
     from driftbuster.reporting import diff as diff_module
 
@@ -134,3 +155,43 @@ def test_build_unified_diff_truncates_large_payloads(monkeypatch: pytest.MonkeyP
     assert diff_limits.get("truncated_lines", 0) >= 0
     assert diff_limits.get("truncated_bytes", 0) >= 0
     assert "diff truncated" in result.diff
+
+
+def _reference_canonicalise_text(payload: str) -> str:
+    working = payload.lstrip("\ufeff")
+    for separator in ("\u2028", "\u2029", "\u0085"):
+        working = working.replace(separator, "\n")
+    normalised = working.replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(line.rstrip() for line in normalised.split("\n"))
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        "\ufeff",
+        "a\n",
+        "a\r\n\r\n",
+        "a \t\nb\r",
+        "\r\u2028x",
+        "keep\x0bvertical\x0ctab \n",
+        "sep\x1c\x1d\x1erow",
+        "mixed\r\r\nend\u0085",
+    ],
+)
+def test_canonicalise_text_matches_replace_based_normalisation(payload: str) -> None:
+    assert canonicalise_text(payload) == _reference_canonicalise_text(payload)
+
+
+def test_canonicalise_text_matches_reference_on_random_input() -> None:
+    import random
+
+    from driftbuster.reporting.diff import _canonicalise
+
+    rng = random.Random(1234)
+    alphabet = "ab \t\r\n\u2028\u2029\u0085\x0b\x0c\x1c"
+    for _ in range(500):
+        payload = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        assert canonicalise_text(payload) == _reference_canonicalise_text(payload), repr(payload)
+        canonical, lines = _canonicalise("text", payload)
+        assert canonical == canonicalise_text(payload)
+        assert list(lines) == canonical.splitlines(), repr(payload)
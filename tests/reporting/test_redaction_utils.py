@@ -62,3 +62,25 @@ def test_resolve_redactor_variants() -> None:
 
     with pytest.raises(ValueError):
         resolve_redactor(redactor=existing, mask_tokens=("oops",))
+
+
+def test_apply_batch_matches_per_line_application() -> None:
+    lines = ["user=admin token=abc", "", "abc abcabc", "plain"]
+
+    batched = RedactionFilter(tokens=("abc", "admin"), placeholder="<x>")
+    per_line = RedactionFilter(tokens=("abc", "admin"), placeholder="<x>")
+
+    assert batched.apply_batch(lines) == [per_line.apply(line) for line in lines]
+    assert batched.stats() == per_line.stats() == {"abc": 4, "admin": 1}
+
+
+def test_apply_batch_falls_back_when_newlines_could_leak() -> None:
+    spanning = RedactionFilter(tokens=("a\nb",))
+    assert spanning.apply_batch(["a", "b"]) == ["a", "b"]
+    assert spanning.has_hits is False
+
+    multiline_placeholder = RedactionFilter(tokens=("secret",), placeholder="[\n]")
+    assert multiline_placeholder.apply_batch(["secret", "x"]) == ["[\n]", "x"]
+
+    assert RedactionFilter(tokens=("x",)).apply_batch(["x\ny", "x"]) == ["[REDACTED]\ny", "[REDACTED]"]
+    assert RedactionFilter(tokens=("x",)).apply_batch([]) == []